@@ -48,9 +48,14 @@ OutputsSpec = Union[
 ]
 
 
+def _as_dict(doc: Mapping[str, Any]) -> dict:
+    # Rendering only reads the document; plain dicts are used as-is
+    return doc if type(doc) is dict else dict(doc)
+
+
 def build_image(doc: Mapping[str, Any]) -> PILImage.Image:
     """Build and return the final Pillow image for the given document."""
-    return build_dashboard_image(dict(doc))
+    return build_dashboard_image(_as_dict(doc))
 
 
 def to_bytes(doc: Mapping[str, Any], format: str = "PNG") -> bytes:
@@ -76,7 +81,7 @@ def render(
 
     Returns a list of plugin results (file path string for the built-in file plugin).
     """
-    doc_dict = dict(doc)
+    doc_dict = _as_dict(doc)
     if validate:
         errors, _warnings = validate_layout(doc_dict)
         if errors:
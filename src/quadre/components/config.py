@@ -5,6 +5,7 @@ Contains all shared configuration including colors, fonts, and dimensions.
 """
 
 import os
+from functools import lru_cache
 from PIL import ImageFont, features
 
 
@@ -155,8 +156,21 @@ def _candidate_paths(system: str, bold: bool) -> list[str]:
     return paths
 
 
+# Loaded fonts keyed by (size, bold, quadre_FONT_PATH); fonts are immutable
+# once created, so every theme/scale application can share them
+_FONT_CACHE: dict[tuple[int, bool, str | None], ImageFont.ImageFont] = {}
+
+
 def load_font(size: int, bold: bool = False) -> ImageFont.ImageFont:
     """Load system font with fallback to default."""
+    key = (size, bold, os.environ.get("quadre_FONT_PATH"))
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = _FONT_CACHE[key] = _load_font(size, bold)
+    return font
+
+
+def _load_font(size: int, bold: bool) -> ImageFont.ImageFont:
     import platform
 
     # Check for custom font path from environment variable
@@ -239,6 +253,8 @@ _BASE_FONT_SIZES = {
 }
 
 _CURRENT_SCALE = 1.0
+# Scaled pixel values for the current scale; cleared by set_scale()
+_PX_CACHE: dict[float | int, int] = {}
 
 
 def px(value: float | int) -> int:
@@ -247,11 +263,20 @@ def px(value: float | int) -> int:
     Keeps integer rounding consistent across the codebase so that component
     paddings and offsets remain proportional when `set_scale()` is active.
     """
+    try:
+        return _PX_CACHE[value]
+    except (KeyError, TypeError):
+        pass
     try:
         f = float(value)
     except Exception:
         f = 0.0
-    return max(0, int(round(f * _CURRENT_SCALE)))
+    scaled = max(0, int(round(f * _CURRENT_SCALE)))
+    try:
+        _PX_CACHE[value] = scaled
+    except TypeError:
+        pass
+    return scaled
 
 
 def set_scale(scale: float) -> None:
@@ -261,6 +286,7 @@ def set_scale(scale: float) -> None:
     """
     global _CURRENT_SCALE
     _CURRENT_SCALE = float(scale) if scale and scale > 0 else 1.0
+    _PX_CACHE.clear()
 
     # Scale dimensions (round to ints)
     for k, v in _BASE_DIMENSIONS.items():
@@ -284,10 +310,12 @@ def reset_scale() -> None:
 
 
 
+@lru_cache(maxsize=32)
 def load_cjk_font(size: int) -> ImageFont.ImageFont:
     """Load a CJK-capable font if available (Noto CJK), else default.
 
-    Covers common CJK Unified Ideographs blocks with a TTC font.
+    Covers common CJK Unified Ideographs blocks with a TTC font. Results are
+    cached per size since TextWidget resolves the fallback on every measure.
     """
     candidates = [
         # Debian/Ubuntu noto-cjk
@@ -36,13 +36,29 @@ class ImageBlock:
             scale = min(avail_w / iw, avail_h / ih)
         return (max(1, int(iw * scale)), max(1, int(ih * scale)))
 
-    def measure(self, w: int, h: int) -> Tuple[int, int]:
-        im = self._open()
-        if not im:
+    def natural_size(self) -> Optional[Tuple[int, int]]:
+        """Return the source image size, or None if it cannot be opened.
+
+        Reads the header only; pixel data is not decoded.
+        """
+        try:
+            with Image.open(self.src) as im:
+                return im.size
+        except Exception:
+            return None
+
+    def measure_natural(
+        self, size: Optional[Tuple[int, int]], w: int, h: int
+    ) -> Tuple[int, int]:
+        """Measure against an already known natural size (see natural_size)."""
+        if not size:
             return (w, min(h, 0))
-        tw, th = self._scale(im.width, im.height, w, h)
+        tw, th = self._scale(size[0], size[1], w, h)
         return (min(w, tw), min(h, th))
 
+    def measure(self, w: int, h: int) -> Tuple[int, int]:
+        return self.measure_natural(self.natural_size(), w, h)
+
     def render(self, draw: ImageDraw.ImageDraw, x: int, y: int, w: int, h: int) -> None:
         base_img: Optional[Image.Image] = getattr(draw, "_quadre_image", None)
         im = self._open()
@@ -14,12 +14,14 @@ class StatusBadge:
     text: str
     variant: str = "secondary"  # default|secondary|destructive|success|warning|outline
 
+    def height(self) -> int:
+        # Independent of the text, so callers can place the badge unmeasured
+        return FONTS.SMALL.size + 2 * px(6)
+
     def measure(self) -> Tuple[int, int]:
-        padx, pady = px(12), px(6)
-        w = int(FONTS.SMALL.getlength(self.text)) + 2 * padx
-        h = FONTS.SMALL.size + 2 * pady
-        return (w, h)
+        w = int(FONTS.SMALL.getlength(self.text)) + 2 * px(12)
+        return (w, self.height())
 
     def render(self, draw: ImageDraw.ImageDraw, x: int, y: int) -> Tuple[int, int]:
-        badge(draw, (x, y), self.text, variant=self.variant, font=FONTS.SMALL)
-        return self.measure()
+        # badge() already returns the drawn size
+        return badge(draw, (x, y), self.text, variant=self.variant, font=FONTS.SMALL)
@@ -27,7 +27,7 @@ from ..utils.dataref import resolve_field
 # -------------------------
 
 ResolveFn = Callable[[Any], Any]
-BuilderFn = Callable[[Dict[str, Any]], "FlexContainer | TextWidget | KPIWidget | Spacer | ImageWidget | ProgressBarWidget | StatusBadgeWidget"]
+BuilderFn = Callable[[Dict[str, Any], Optional[Dict[str, Any]]], "FlexContainer | TextWidget | KPIWidget | Spacer | ImageWidget | ProgressBarWidget | StatusBadgeWidget"]
 
 
 def _int_from_props(props: Dict[str, Any], name: str, default: int = 0) -> int:
@@ -163,11 +163,12 @@ def _build_row_or_column(
     merged.setdefault("gap", gap)
     cont = _apply_container_defaults(cont, merged)
     for child in node.get("children", []) or []:
-        w = builder(child)
+        # Normalize child properties once; the builder reuses them
+        cprops = _norm_props(child.get("properties") if isinstance(child, dict) else None)
+        w = builder(child, cprops)
         grow: float = 0.0
         shrink: float = 1.0
         basis: Optional[int] = None
-        cprops = _norm_props(child.get("properties", {}) if isinstance(child, dict) else {})
         ratio = cprops.get("width_ratio")
         fill_remaining = bool(cprops.get("fill_remaining"))
         height_prop = cprops.get("height")
@@ -201,7 +202,7 @@ def _build_grid(node: Dict[str, Any], props: Dict[str, Any], resolve: ResolveFn,
     for i in range(0, len(children), cols):
         row = FlexContainer(direction="row", gap=gap)
         for c in children[i : i + cols]:
-            row.add(builder(c), grow=1.0)
+            row.add(builder(c, None), grow=1.0)
         grid_col.add(row)
     return grid_col
 
@@ -213,9 +214,12 @@ def build_layout_from_declarative(data: Dict[str, Any]) -> FlexContainer:
     def _resolve_field(v: Any) -> Any:
         return resolve_field(data, v)
 
-    def build_node(node: Dict[str, Any]) -> FlexContainer | TextWidget | KPIWidget | Spacer | ImageWidget | ProgressBarWidget | StatusBadgeWidget:
+    def build_node(
+        node: Dict[str, Any], props: Optional[Dict[str, Any]] = None
+    ) -> FlexContainer | TextWidget | KPIWidget | Spacer | ImageWidget | ProgressBarWidget | StatusBadgeWidget:
         t = node.get("type")
-        props = _norm_props(node.get("properties", {}) or {})
+        if props is None:
+            props = _norm_props(node.get("properties", {}) or {})
 
         # Structural pattern matching on the node type
         match t:
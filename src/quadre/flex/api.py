@@ -20,7 +20,7 @@ def dref(path: str) -> Dict[str, str]:
     return {"$": path}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Component:
     """Base builder component.
 
@@ -109,7 +109,7 @@ class Component:
 # --------- Leaf widgets ---------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Text(Component):
     text: Content = ""
 
@@ -130,7 +130,7 @@ class Text(Component):
         return out
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Title(Component):
     title: Content = ""
     date_note: Optional[Content] = None
@@ -144,7 +144,7 @@ class Title(Component):
         return out
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class KPI(Component):
     title: Content = ""
     value: Content = ""
@@ -163,7 +163,7 @@ class KPI(Component):
         return out
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Table(Component):
     # Provide either table payload (headers+rows) or rows-only L.o.L
     table: Any = None
@@ -188,7 +188,7 @@ class Table(Component):
         return out
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Spacer(Component):
     size: int = 10
 
@@ -201,7 +201,7 @@ class Spacer(Component):
         return out
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Image(Component):
     src: Content = ""
 
@@ -224,7 +224,7 @@ class Image(Component):
         return out
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Progress(Component):
     value: Union[int, float] = 0.0  # 0..1 or percentage (>1)
     label: Optional[Content] = None
@@ -249,7 +249,7 @@ class Progress(Component):
         return out
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StatusBadge(Component):
     text: Content = ""
     variant_value: str = "secondary"
@@ -269,7 +269,7 @@ class StatusBadge(Component):
 # --------- Containers ---------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Row(Component):
     children: Sequence[Component] = field(default_factory=list)
 
@@ -286,7 +286,7 @@ class Row(Component):
         return out
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Column(Component):
     children: Sequence[Component] = field(default_factory=list)
 
@@ -303,7 +303,7 @@ class Column(Component):
         return out
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Grid(Component):
     children: Sequence[Component] = field(default_factory=list)
     columns_value: int = 2
@@ -331,7 +331,7 @@ class Grid(Component):
 # --------- Document helpers ---------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Doc:
     layout: Sequence[Component]
     data: Optional[Dict[str, Any]] = None
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Dict, Optional, Tuple
 from ..components import COLORS
 
@@ -20,10 +21,11 @@ def _load_defaults() -> Dict[str, Any]:
     return _CACHED_DEFAULTS
 
 
-def defaults_for(widget: str) -> Dict[str, Any]:
+def defaults_for(widget: str, copy: bool = True) -> Dict[str, Any]:
     d = _load_defaults().get(widget, {})
-    # make a shallow copy to avoid accidental mutations
-    return dict(d)
+    # make a shallow copy to avoid accidental mutations; read-only callers
+    # that merge into their own dict can pass copy=False
+    return dict(d) if copy else d
 
 
 def set_widget_defaults(defaults: Dict[str, Any] | None) -> None:
@@ -52,15 +54,22 @@ def parse_color(value: Any) -> Optional[Tuple[int, int, int]]:
             themed = getattr(COLORS, attr)
             if isinstance(themed, str):
                 return parse_color(themed)
-        # Hex parsing (with or without leading '#')
-        if s.startswith('#'):
-            s = s[1:]
-        if len(s) == 6:
-            try:
-                r = int(s[0:2], 16)
-                g = int(s[2:4], 16)
-                b = int(s[4:6], 16)
-                return (r, g, b)
-            except Exception:
-                return None
+        return _parse_hex(s)
+    return None
+
+
+@lru_cache(maxsize=256)
+def _parse_hex(s: str) -> Optional[Tuple[int, int, int]]:
+    # Hex parsing (with or without leading '#'); theme tokens are resolved
+    # by the caller since they depend on the active COLORS
+    if s.startswith('#'):
+        s = s[1:]
+    if len(s) == 6:
+        try:
+            r = int(s[0:2], 16)
+            g = int(s[2:4], 16)
+            b = int(s[4:6], 16)
+            return (r, g, b)
+        except Exception:
+            return None
     return None
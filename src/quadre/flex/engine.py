@@ -5,15 +5,139 @@ resolve_path is re-imported here for backward compatibility.
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import List, Optional, Tuple
 
-from PIL import Image, ImageDraw, ImageFont, ImageFilter
+from PIL import Image, ImageDraw, ImageFilter
+
+
+# Shadow sprites keyed by (w, h, radius, alpha, blur), least recently used
+# first. The cache is bounded by total pixel area rather than entry count:
+# it never holds more than _SHADOW_CACHE_PIXELS RGBA pixels (16 MB), and a
+# sprite larger than that on its own is not cached at all.
+_SHADOW_CACHE: "OrderedDict[Tuple[int, int, int, int, int], Image.Image]" = OrderedDict()
+_SHADOW_CACHE_PIXELS = 4_000_000
+_shadow_cache_area = 0
+
+
+def _shadow_sprite(w: int, h: int, radius: int, alpha: int, blur: int) -> Image.Image:
+    """Blurred rounded-rectangle shadow; same-sized cards share one sprite.
+
+    Callers only paste it, so the cached image is never modified.
+    """
+    global _shadow_cache_area
+    key = (w, h, radius, alpha, blur)
+    sh = _SHADOW_CACHE.get(key)
+    if sh is not None:
+        _SHADOW_CACHE.move_to_end(key)
+        return sh
+    sh = Image.new("RGBA", (w, h), (0, 0, 0, 0))
+    sdraw = ImageDraw.Draw(sh)
+    sdraw.rounded_rectangle((0, 0, w, h), radius, fill=(0, 0, 0, alpha))
+    if blur and blur > 0:
+        sh = sh.filter(ImageFilter.GaussianBlur(blur))
+    area = w * h
+    if area <= _SHADOW_CACHE_PIXELS:
+        _SHADOW_CACHE[key] = sh
+        _shadow_cache_area += area
+        while _shadow_cache_area > _SHADOW_CACHE_PIXELS:
+            _, old = _SHADOW_CACHE.popitem(last=False)
+            _shadow_cache_area -= old.width * old.height
+    return sh
+
+
+def _distribute(
+    total: int, weights: List[float], wsum: Optional[float] = None
+) -> List[int]:
+    """Split ``total`` pixels proportionally to ``weights``.
+
+    Uses cumulative integer rounding so the shares always sum to ``total``
+    (no pixels lost to per-item truncation). ``wsum`` may pass a known sum.
+    """
+    if wsum is None:
+        wsum = sum(weights)
+    shares: List[int] = []
+    acc = 0.0
+    prev = 0
+    for wt in weights:
+        acc += wt
+        cur = int(total * acc / wsum)
+        shares.append(cur - prev)
+        prev = cur
+    return shares
+
+
+def _justify(justify: str, remaining: int, gap: int, n: int) -> Tuple[int, int]:
+    """Return (start offset, gap between items) for a justify_content mode."""
+    if justify == "center":
+        return remaining // 2, gap
+    if justify == "end":
+        return remaining, gap
+    if n > 1:
+        if justify == "space-between":
+            return 0, gap + remaining // (n - 1)
+        if justify == "space-around":
+            # equal space around each item: half at ends
+            gap_val = gap + remaining // n
+            return gap_val // 2, gap_val
+        if justify == "space-evenly":
+            # equal spaces including ends
+            gap_val = gap + remaining // (n + 1)
+            return gap_val, gap_val
+    return 0, gap
+
+
+def _cross_place(align: str, cross: int, start: int, space: int) -> Tuple[int, int]:
+    """Return (position, size) of a child on the cross axis."""
+    if align == "stretch":
+        return start, space
+    cross = min(cross, space)
+    if align == "center":
+        return start + (space - cross) // 2, cross
+    if align == "end":
+        return start + (space - cross), cross
+    return start, cross
+
+
+def _acquire_layer(
+    draw: ImageDraw.ImageDraw, w: int, h: int
+) -> Tuple[Image.Image, ImageDraw.ImageDraw]:
+    """Return a cleared RGBA layer of size (w, h) and a draw bound to it.
+
+    Layers come from the frame pool stored on the draw object
+    ("_quadre_layers"); pooled layers keep their draw, so neither the image
+    nor the ImageDraw is reallocated when a size repeats.
+    """
+    pool = getattr(draw, "_quadre_layers", None)
+    if pool:
+        stack = pool.get((w, h))
+        if stack:
+            layer, ldraw = stack.pop()
+            layer.paste((0, 0, 0, 0), (0, 0, w, h))
+            return layer, ldraw
+    layer = Image.new("RGBA", (w, h), (0, 0, 0, 0))
+    ldraw = ImageDraw.Draw(layer)
+    # Propagate the backing image and layer pool for child widgets
+    setattr(ldraw, "_quadre_image", layer)
+    setattr(ldraw, "_quadre_layers", pool)
+    return layer, ldraw
+
+
+def _release_layer(
+    draw: ImageDraw.ImageDraw, layer: Image.Image, ldraw: ImageDraw.ImageDraw
+) -> None:
+    pool = getattr(draw, "_quadre_layers", None)
+    if pool is not None:
+        pool.setdefault(layer.size, []).append((layer, ldraw))
 
 
 class Widget:
     """Base widget interface for the flex engine."""
 
+    # Lets slotted subclasses drop the per-instance __dict__
+    __slots__ = ()
+
     def measure(
         self, draw: ImageDraw.ImageDraw, avail_w: int, avail_h: int
     ) -> Tuple[int, int]:
@@ -24,8 +148,15 @@ class Widget:
         """Render into the given box (x,y,w,h)."""
         raise NotImplementedError
 
+    def needs_clip(self, draw: ImageDraw.ImageDraw, w: int, h: int) -> bool:
+        """Whether rendering into a (w, h) box may paint outside of it.
+
+        Containers skip the offscreen clipping layer for children returning False.
+        """
+        return True
 
-@dataclass
+
+@dataclass(slots=True)
 class FixedBox(Widget):
     width: int
     height: int
@@ -39,16 +170,22 @@ class FixedBox(Widget):
         return (min(self.width, avail_w), min(self.height, avail_h))
 
     def render(self, draw: ImageDraw.ImageDraw, x: int, y: int, w: int, h: int) -> None:
+        if w <= 0 or h <= 0:
+            return  # collapsed box: nothing to draw
         r = min(self.radius, min(w, h) // 2)
+        # Inset bottom/right by 1px: PIL rectangle bounds are inclusive
         draw.rounded_rectangle(
-            (x, y, x + w, y + h), r, fill=self.fill, outline=self.outline
+            (x, y, x + w - 1, y + h - 1), r, fill=self.fill, outline=self.outline
         )
 
+    def needs_clip(self, draw: ImageDraw.ImageDraw, w: int, h: int) -> bool:
+        return False
+
 
     # TextWidget moved to flex.widgets
 
 
-@dataclass
+@dataclass(slots=True)
 class FlexItem:
     widget: Widget
     grow: float = 0.0
@@ -57,7 +194,7 @@ class FlexItem:
     align_self: Optional[str] = None  # start|center|end|stretch
 
 
-@dataclass
+@dataclass(slots=True)
 class FlexContainer(Widget):
     children: List[FlexItem] = field(default_factory=list)
     direction: str = "row"  # row|column
@@ -95,141 +232,189 @@ class FlexContainer(Widget):
     def measure(
         self, draw: ImageDraw.ImageDraw, avail_w: int, avail_h: int
     ) -> Tuple[int, int]:
-        inner_w = max(0, avail_w - 2 * self.padding)
-        inner_h = max(0, avail_h - 2 * self.padding)
+        pad2 = 2 * self.padding
+        inner_w = max(0, avail_w - pad2)
+        inner_h = max(0, avail_h - pad2)
 
         main_sum = 0
         cross_max = 0
         is_row = self.direction == "row"
 
-        for i, item in enumerate(self.children):
-            mw, mh = item.widget.measure(draw, inner_w, inner_h)
-            if is_row:
-                base = item.basis if item.basis is not None else mw
-                main_sum += base
-                cross_max = max(cross_max, mh)
-            else:
-                base = item.basis if item.basis is not None else mh
-                main_sum += base
-                cross_max = max(cross_max, mw)
+        # Index of the main/cross extent in a measured (w, h) pair
+        mi, ci = (0, 1) if is_row else (1, 0)
+        for item in self.children:
+            size = item.widget.measure(draw, inner_w, inner_h)
+            main_sum += size[mi] if item.basis is None else item.basis
+            cross = size[ci]
+            if cross > cross_max:
+                cross_max = cross
 
-        if len(self.children) > 1:
-            main_sum += (len(self.children) - 1) * self.gap
+        n = len(self.children)
+        if n > 1:
+            main_sum += (n - 1) * self.gap
 
-        preferred_w = (main_sum if is_row else cross_max) + 2 * self.padding
-        preferred_h = (cross_max if is_row else main_sum) + 2 * self.padding
+        preferred_w = (main_sum if is_row else cross_max) + pad2
+        preferred_h = (cross_max if is_row else main_sum) + pad2
         return (min(preferred_w, avail_w), min(preferred_h, avail_h))
 
+    def needs_clip(self, draw: ImageDraw.ImageDraw, w: int, h: int) -> bool:
+        # Shadows, backgrounds and unclipped children may paint past the box.
+        # Otherwise render() clips every child rect to the box itself, so no
+        # measurement is needed here. (Placeholders of collapsed children are
+        # drawn unclipped, as they always were.)
+        return bool(self.shadow or self.bg_fill or self.bg_outline or not self.clip_children)
+
+    def _is_static(self) -> bool:
+        # Without growing children the measured bases are the final sizes
+        # whenever the content fits
+        for item in self.children:
+            if item.grow:
+                return False
+        return True
+
+    def _stack_rects(
+        self,
+        draw: ImageDraw.ImageDraw,
+        x: int,
+        y: int,
+        w: int,
+        h: int,
+        is_row: bool,
+    ) -> Optional[List[Tuple[int, int, int, int]]]:
+        """Measure and place static children in one pass (justify start).
+
+        Returns None on overflow so the caller can apply shrink rules.
+        """
+        rects: List[Tuple[int, int, int, int]] = []
+        gap = self.gap
+        default_align = self.align_items
+        mi, ci = (0, 1) if is_row else (1, 0)
+        cur = x if is_row else y
+        main_end = (x + w) if is_row else (y + h)
+        cross_start = y if is_row else x
+        cross_space = h if is_row else w
+        for item in self.children:
+            align = item.align_self or default_align
+            basis = item.basis
+            if basis is not None and align == "stretch":
+                main, cross = basis, cross_space
+            else:
+                size = item.widget.measure(draw, w, h)
+                main = size[mi] if basis is None else basis
+                cross = size[ci]
+            cross_pos, cross = _cross_place(align, cross, cross_start, cross_space)
+            if is_row:
+                rects.append((cur, cross_pos, main, cross))
+            else:
+                rects.append((cross_pos, cur, cross, main))
+            cur += main + gap
+        if rects and cur - gap > main_end:
+            return None
+        return rects
+
     def _layout(
         self, draw: ImageDraw.ImageDraw, x: int, y: int, w: int, h: int
     ) -> List[Tuple[int, int, int, int]]:
         # Compute layout rects for each child
         is_row = self.direction == "row"
-        inner_x = x + self.padding
-        inner_y = y + self.padding
-        inner_w = max(0, w - 2 * self.padding)
-        inner_h = max(0, h - 2 * self.padding)
+        pad = self.padding
+        inner_x = x + pad
+        inner_y = y + pad
+        inner_w = max(0, w - 2 * pad)
+        inner_h = max(0, h - 2 * pad)
+
+        # Fast path: static children packed from the start (root, plain
+        # columns, margin wrappers, titles) need no free-space distribution
+        if self.justify_content == "start" and self._is_static():
+            stacked = self._stack_rects(
+                draw, inner_x, inner_y, inner_w, inner_h, is_row
+            )
+            if stacked is not None:
+                return stacked
 
-        # 1) Determine base sizes
+        # 1) Determine base sizes; the totals needed to distribute free
+        # space are accumulated in the same pass over the children
         bases: List[int] = []  # along main axis
         cross_sizes: List[int] = []
+        grows: List[float] = []
+        shrinks: List[float] = []
+        default_align = self.align_items
+        add_base = bases.append
+        add_cross = cross_sizes.append
+        mi, ci = (0, 1) if is_row else (1, 0)
+        base_sum = 0
+        grow_sum = 0.0
+        shrink_sum = 0.0
         for item in self.children:
-            mw, mh = item.widget.measure(draw, inner_w, inner_h)
-            if is_row:
-                bases.append(item.basis if item.basis is not None else mw)
-                cross_sizes.append(mh)
-            else:
-                bases.append(item.basis if item.basis is not None else mh)
-                cross_sizes.append(mw)
+            grows.append(item.grow)
+            shrinks.append(item.shrink)
+            grow_sum += item.grow
+            shrink_sum += item.shrink
+            basis = item.basis
+            if basis is not None and (item.align_self or default_align) == "stretch":
+                # Fixed main size and stretched cross size: a measure would be discarded
+                add_base(basis)
+                add_cross(0)
+                base_sum += basis
+                continue
+            size = item.widget.measure(draw, inner_w, inner_h)
+            main = size[mi] if basis is None else basis
+            add_base(main)
+            add_cross(size[ci])
+            base_sum += main
 
         main_space = inner_w if is_row else inner_h
-        total_gaps = self.gap * max(0, len(self.children) - 1)
-        used = sum(bases) + total_gaps
-        free = main_space - used
-
-        # 2) Distribute free space (grow) or shrink if negative
-        sizes = bases[:]
+        gap = self.gap
+        n = len(bases)
+        total_gaps = gap * max(0, n - 1)
+        free = main_space - (base_sum + total_gaps)
+
+        # 2) Distribute free space (grow) or shrink if negative; bases are
+        # not needed afterwards, so they are adjusted in place
+        sizes = bases
+        used = base_sum
         if free > 0:
-            grow_sum = sum(ci.grow for ci in self.children)
             if grow_sum > 0:
-                for i, ci in enumerate(self.children):
-                    sizes[i] += int(free * (ci.grow / grow_sum))
+                for i, extra in enumerate(_distribute(free, grows, grow_sum)):
+                    sizes[i] += extra
+                used += free
         elif free < 0:
-            shrink_sum = sum(ci.shrink for ci in self.children)
             if shrink_sum > 0:
-                deficit = -free
-                for i, ci in enumerate(self.children):
-                    sizes[i] -= int(deficit * (ci.shrink / shrink_sum))
-                    sizes[i] = max(0, sizes[i])
+                used = 0
+                for i, cut in enumerate(_distribute(-free, shrinks, shrink_sum)):
+                    size = sizes[i] - cut
+                    if size < 0:
+                        size = 0
+                    sizes[i] = size
+                    used += size
 
         # 3) Compute positions along main axis
-        rects: List[Tuple[int, int, int, int]] = []
+        rects: List[Tuple[int, int, int, int]] = [(0, 0, 0, 0)] * n
         cur_main_base = inner_x if is_row else inner_y
 
         # Remaining space after sizes + default gaps
-        actual_used = sum(sizes) + total_gaps
-        remaining = max(0, main_space - actual_used)
+        remaining = max(0, main_space - used - total_gaps)
 
         # Adjust start offset and inter-item gap according to justify_content
-        gap_val = self.gap
-        offset = 0
-        n = len(self.children)
-        if self.justify_content in ("center", "end") or (
-            self.justify_content.startswith("space") and n > 1
-        ):
-            if self.justify_content == "center":
-                offset = remaining // 2
-            elif self.justify_content == "end":
-                offset = remaining
-            elif self.justify_content == "space-between" and n > 1:
-                gap_val = self.gap + (remaining // (n - 1))
-            elif self.justify_content == "space-around" and n > 0:
-                # equal space around each item: half at ends
-                gap_val = self.gap + (remaining // n)
-                offset = gap_val // 2
-            elif self.justify_content == "space-evenly" and n > 0:
-                # equal spaces including ends
-                gap_val = self.gap + (remaining // (n + 1))
-                offset = gap_val
+        offset, gap_val = _justify(self.justify_content, remaining, gap, n)
+
+        # Cross-axis geometry is the same for every child; only the
+        # alignment keyword varies, and it is resolved once per child.
+        cross_start = inner_y if is_row else inner_x
+        cross_space = inner_h if is_row else inner_w
 
         cur_main = cur_main_base + offset
         for i, ci in enumerate(self.children):
             main_size = sizes[i]
-            cross = cross_sizes[i]
+            cross_pos, cross = _cross_place(
+                ci.align_self or default_align, cross_sizes[i], cross_start, cross_space
+            )
 
             if is_row:
-                cw = main_size
-                ch = (
-                    inner_h
-                    if (ci.align_self or self.align_items) == "stretch"
-                    else min(cross, inner_h)
-                )
-                # Align on cross axis
-                align = ci.align_self or self.align_items
-                if align == "center":
-                    cy = inner_y + (inner_h - ch) // 2
-                elif align == "end":
-                    cy = inner_y + (inner_h - ch)
-                else:  # start or stretch
-                    cy = inner_y
-                rects.append((cur_main, cy, cw, ch))
-                cur_main += cw + gap_val
+                rects[i] = (cur_main, cross_pos, main_size, cross)
             else:
-                ch = main_size
-                cw = (
-                    inner_w
-                    if (ci.align_self or self.align_items) == "stretch"
-                    else min(cross, inner_w)
-                )
-                align = ci.align_self or self.align_items
-                if align == "center":
-                    cx = inner_x + (inner_w - cw) // 2
-                elif align == "end":
-                    cx = inner_x + (inner_w - cw)
-                else:
-                    cx = inner_x
-                rects.append((cx, cur_main, cw, ch))
-                cur_main += ch + gap_val
+                rects[i] = (cross_pos, cur_main, cross, main_size)
+            cur_main += main_size + gap_val
 
         return rects
 
@@ -238,11 +423,7 @@ class FlexContainer(Widget):
         # optional shadow behind background
         if self.shadow and base_img is not None and w > 0 and h > 0:
             r = min(self.bg_radius, min(w, h) // 2)
-            sh = Image.new("RGBA", (w, h), (0, 0, 0, 0))
-            sdraw = ImageDraw.Draw(sh)
-            sdraw.rounded_rectangle((0, 0, w, h), r, fill=(0, 0, 0, max(0, min(255, self.shadow_alpha))))
-            if self.shadow_radius and self.shadow_radius > 0:
-                sh = sh.filter(ImageFilter.GaussianBlur(self.shadow_radius))
+            sh = _shadow_sprite(w, h, r, max(0, min(255, self.shadow_alpha)), self.shadow_radius)
             base_img.paste(sh, (x + self.shadow_offset_x, y + self.shadow_offset_y), sh)
         # optional background
         if self.bg_fill or self.bg_outline:
@@ -255,22 +436,41 @@ class FlexContainer(Widget):
         # "_quadre_image". Use that to enable per-child clipping via
         # offscreen layers. Previously this looked up "_ezp_image",
         # which disabled clipping and could cause overlap between siblings.
-        base_img = getattr(draw, "_quadre_image", None)
-        for item, rect in zip(self.children, rects):
-            ix, iy, iw, ih = rect
-            if self.clip_children and base_img is not None and iw > 0 and ih > 0:
-                # Render child into an offscreen layer to guarantee no overdraw outside bounds
-                layer = Image.new("RGBA", (iw, ih), (0, 0, 0, 0))
-                ldraw = ImageDraw.Draw(layer)
-                # Propagate the backing image for child widgets that expect it
-                setattr(ldraw, "_quadre_image", layer)
-                try:
-                    item.widget.render(ldraw, 0, 0, iw, ih)
-                finally:
-                    # Composite with its own alpha as mask
-                    base_img.paste(layer, (ix, iy), layer)
-            else:
-                item.widget.render(draw, ix, iy, iw, ih)
+        clip = self.clip_children and base_img is not None
+        if clip:
+            if getattr(draw, "_quadre_layers", None) is None:
+                # Callers outside the runner may not have set up a frame pool
+                setattr(draw, "_quadre_layers", {})
+            paste = base_img.paste
+        x1, y1 = x + w, y + h
+        for item, (ix, iy, iw, ih) in zip(self.children, rects):
+            widget = item.widget
+            if not clip:
+                widget.render(draw, ix, iy, iw, ih)
+                continue
+            if iw <= 0 or ih <= 0:
+                # Empty rect: widgets that stay in bounds paint nothing; the
+                # rest (e.g. placeholders) draw directly, unclipped
+                if widget.needs_clip(draw, iw, ih):
+                    widget.render(draw, ix, iy, iw, ih)
+                continue
+            inside = ix >= x and iy >= y and ix + iw <= x1 and iy + ih <= y1
+            if inside and not widget.needs_clip(draw, iw, ih):
+                widget.render(draw, ix, iy, iw, ih)
+                continue
+            # Clip to the child rect, cut to our box when content overflows
+            cx0, cy0 = max(ix, x), max(iy, y)
+            cx1, cy1 = min(ix + iw, x1), min(iy + ih, y1)
+            if cx0 >= cx1 or cy0 >= cy1:
+                continue  # nothing of it would be visible
+            # Render child into an offscreen layer to guarantee no overdraw outside bounds
+            layer, ldraw = _acquire_layer(draw, cx1 - cx0, cy1 - cy0)
+            try:
+                widget.render(ldraw, ix - cx0, iy - cy0, iw, ih)
+            finally:
+                # Composite with its own alpha as mask
+                paste(layer, (cx0, cy0), layer)
+                _release_layer(draw, layer, ldraw)
 
 
 # End of file
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Dict, Any
 
-from ..components import COLORS, DIMENSIONS, FONTS
+from ..components import COLORS, DIMENSIONS
 from .defaults import defaults_for, parse_color
 from .engine import FlexContainer
 from .widgets import TextWidget
@@ -10,7 +10,7 @@ from .widgets import TableWidget, Spacer
 
 
 def _apply_container_defaults(cont: FlexContainer, overrides: Dict[str, Any] | None = None) -> FlexContainer:
-    d = defaults_for("FlexContainer")
+    d = defaults_for("FlexContainer", copy=False)
     ov = overrides or {}
     cont.gap = int(ov.get("gap", d.get("gap", cont.gap)))
     cont.align_items = ov.get("align_items", d.get("align_items", cont.align_items))
@@ -45,7 +45,7 @@ def _apply_container_defaults(cont: FlexContainer, overrides: Dict[str, Any] | N
 
 
 def _text_from_props(text: str, props: Dict[str, Any] | None = None) -> TextWidget:
-    d = defaults_for("TextWidget")
+    d = defaults_for("TextWidget", copy=False)
     p = dict(d)
     if props:
         p.update(_norm_props(props))
@@ -58,7 +58,7 @@ def _text_from_props(text: str, props: Dict[str, Any] | None = None) -> TextWidg
 
 
 def _table_from_props(tbl_data: Any, props: Dict[str, Any] | None = None) -> TableWidget:
-    d = defaults_for("TableWidget")
+    d = defaults_for("TableWidget", copy=False)
     p = dict(d)
     if props:
         p.update(_norm_props(props))
@@ -81,7 +81,7 @@ def _table_from_props(tbl_data: Any, props: Dict[str, Any] | None = None) -> Tab
 
 
 def _spacer_from_props(props: Dict[str, Any] | None = None) -> Spacer:
-    d = defaults_for("Spacer")
+    d = defaults_for("Spacer", copy=False)
     p = _norm_props(props or {})
     h = int(p.get("height", d.get("height", DIMENSIONS.GAP_MEDIUM)))
     return Spacer(h)
@@ -94,4 +94,11 @@ def _norm_props(props: Dict[str, Any] | None) -> Dict[str, Any]:
     """
     if not isinstance(props, dict):
         return {}
-    return {str(k).lower(): v for k, v in props.items()}
+    out: Dict[str, Any] = {}
+    for k, v in props.items():
+        # Keys from JSON documents are usually lower-case already
+        if type(k) is str and k.islower():
+            out[k] = v
+        else:
+            out[str(k).lower()] = v
+    return out
@@ -14,6 +14,33 @@ from ..theme import (
 from .defaults import set_widget_defaults
 from .adapter import build_layout_from_declarative
 from ..plugins import dispatch_outputs
+from .engine import Widget
+
+
+def _render_frame(root: Widget, img: Image.Image) -> None:
+    """Render the layout into the full image with a frame-scoped layer pool."""
+    draw = ImageDraw.Draw(img)
+    setattr(draw, "_quadre_image", img)
+    pool: Dict[Any, Any] = {}
+    setattr(draw, "_quadre_layers", pool)
+    try:
+        root.render(draw, 0, 0, img.width, img.height)
+    finally:
+        # Release pooled clip layers before downscale/sharpen allocate more
+        pool.clear()
+
+
+def _downsample(img: Image.Image, size: tuple[int, int]) -> Image.Image:
+    """Downscale a supersampled frame with a box-reduce pre-pass.
+
+    With reducing_gap=1.0 Pillow first box-reduces by the whole integer
+    factor, leaving LANCZOS only the fractional remainder. On the all-widgets
+    example this is ~2x faster at scale 2 and ~10x faster at scale 3, but it
+    is not lossless: antialiased edges come out slightly softer (mean channel
+    difference under 0.4/255, up to ~40/255 on thin glyph edges). Larger gaps
+    (2.0 and up) never trigger the pre-pass at the 2-3x scales used here.
+    """
+    return img.resize(size, Image.LANCZOS, reducing_gap=1.0)
 
 
 def build_dashboard_image(data: Dict[str, Any]) -> Image.Image:
@@ -92,8 +119,9 @@ def build_dashboard_image(data: Dict[str, Any]) -> Image.Image:
         # refresh scaled W/H
         W, H_default = DIMENSIONS.WIDTH, DIMENSIONS.HEIGHT
 
-    # Measure preferred height with a huge available height (scaled)
-    probe_img = Image.new("RGB", (W, 10), COLORS.BACKGROUND)
+    # Measure preferred height with a huge available height (scaled). Measuring
+    # only reads font metrics, so a 1x1 surface is enough regardless of W.
+    probe_img = Image.new("RGB", (1, 1), COLORS.BACKGROUND)
     probe_draw = ImageDraw.Draw(probe_img)
     setattr(probe_draw, "_quadre_image", probe_img)
     _, preferred_h = root.measure(probe_draw, W, 10_000_000)
@@ -111,15 +139,13 @@ def build_dashboard_image(data: Dict[str, Any]) -> Image.Image:
         # Choose final height based on content within bounds
         final_h = max(min_auto_h, min(preferred_h + default_auto_bottom_margin, max_auto_h))
         img = Image.new("RGB", (W, final_h), COLORS.BACKGROUND)
-        draw = ImageDraw.Draw(img)
-        setattr(draw, "_quadre_image", img)
-        root.render(draw, 0, 0, W, final_h)
+        _render_frame(root, img)
         if scale != 1.0 and downscale:
             # Downsample to base size with high-quality filter. Use rounding to
             # avoid systematic 1px cropping when final_h is not an exact
             # multiple of the scale factor.
             target_h = max(int(round(final_h / scale)), 1)
-            img = img.resize((base_W, target_h), Image.LANCZOS)
+            img = _downsample(img, (base_W, target_h))
         final_img = img
     else:
         # Cap offscreen height to avoid excessive memory usage
@@ -129,13 +155,11 @@ def build_dashboard_image(data: Dict[str, Any]) -> Image.Image:
 
         # Render to offscreen then crop to fixed page height
         off = Image.new("RGB", (W, off_h), COLORS.BACKGROUND)
-        off_draw = ImageDraw.Draw(off)
-        setattr(off_draw, "_quadre_image", off)
-        root.render(off_draw, 0, 0, W, off_h)
+        _render_frame(root, off)
 
         final = off.crop((0, 0, W, H_page)) if off_h != H_page else off
         if scale != 1.0 and downscale:
-            final = final.resize((base_W, int(round(H_page / scale))), Image.LANCZOS)
+            final = _downsample(final, (base_W, int(round(H_page / scale))))
         final_img = final
 
     # Optional unsharp mask to improve perceived text crispness after downscale.
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 from typing import List, Optional, Tuple, Union
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import ImageDraw, ImageFont
 
 from .engine import Widget
 from ..components import DIMENSIONS, KPICard, COLORS, FONTS, ImageBlock, ProgressBar, StatusBadge
@@ -192,6 +193,9 @@ class Spacer(Widget):
         # No drawing; space only
         return None
 
+    def needs_clip(self, draw: ImageDraw.ImageDraw, w: int, h: int) -> bool:
+        return False
+
 
 # -------------------------
 # Additional reporting widgets
@@ -205,11 +209,14 @@ class ImageWidget(Widget):
     radius: int = 0
     opacity: float = 1.0
     align: str = "center"  # left|center|right
+    # (src, natural size) so repeated measure passes do not reopen the file
+    _natural: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
 
     def measure(self, draw: ImageDraw.ImageDraw, avail_w: int, avail_h: int) -> Tuple[int, int]:
         block = ImageBlock(self.src, self.fit, self.radius, self.opacity, self.align)
-        mw, mh = block.measure(avail_w, avail_h)
-        return (mw, mh)
+        if self._natural is None or self._natural[0] != self.src:
+            self._natural = (self.src, block.natural_size())
+        return block.measure_natural(self._natural[1], avail_w, avail_h)
 
     def render(self, draw: ImageDraw.ImageDraw, x: int, y: int, w: int, h: int) -> None:
         block = ImageBlock(self.src, self.fit, self.radius, self.opacity, self.align)
@@ -247,19 +254,30 @@ class StatusBadgeWidget(Widget):
     def render(self, draw: ImageDraw.ImageDraw, x: int, y: int, w: int, h: int) -> None:
         # Align within box: left + vertically centered
         sb = StatusBadge(self.text, self.variant)
-        _, bh = sb.measure()
-        by = y + (h - bh) // 2
+        by = y + (h - sb.height()) // 2
         sb.render(draw, x, by)
-from dataclasses import dataclass
 
 
-@dataclass
+# CJK Unified Ideographs (+ Extension A, Compatibility) rendered with the CJK font
+_CJK_RANGES = ((0x4E00, 0x9FFF), (0x3400, 0x4DBF), (0xF900, 0xFAFF))
+
+# Splits text into alternating non-CJK / CJK runs (odd indices are CJK)
+_CJK_SPLIT = re.compile(
+    "([" + "".join(f"{chr(lo)}-{chr(hi)}" for lo, hi in _CJK_RANGES) + "]+)"
+)
+
+
+@dataclass(slots=True)
 class TextWidget(Widget):
     text: str
     fill: Tuple[int, int, int] = (20, 20, 20)
     font: Optional[ImageFont.ImageFont] = None
     font_key: Optional[str] = None  # dynamic key resolved against FONTS at render time
     align: str = "left"  # left|center|right
+    # (base font, text, metrics) from the last measurement; see _metrics()
+    _runs_cache: Optional[tuple] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def _font(self) -> ImageFont.ImageFont:
         # Prefer dynamic lookup if a key is provided (keeps in sync with scaling)
@@ -288,35 +306,43 @@ class TextWidget(Widget):
             size = 14
         return load_cjk_font(size)
 
-    @staticmethod
-    def _is_cjk(ch: str) -> bool:
-        o = ord(ch)
-        return (
-            0x4E00 <= o <= 0x9FFF
-            or 0x3400 <= o <= 0x4DBF
-            or 0xF900 <= o <= 0xFAFF
-        )
-
     def _segment_runs(self) -> List[Tuple[str, ImageFont.ImageFont]]:
+        text = self.text
+        if not text:
+            return []
         base = self._font()
+        # ASCII cannot contain CJK; skip resolving the fallback font entirely
+        if text.isascii():
+            return [(text, base)]
         cjk = self._cjk_font()
+        if cjk is base:
+            return [(text, base)]
+        # Run boundaries are found by the regex engine rather than per character
         segments: List[Tuple[str, ImageFont.ImageFont]] = []
-        buf: List[str] = []
-        cur_font = base
-        for ch in self.text:
-            want = cjk if self._is_cjk(ch) else base
-            if want is cur_font:
-                buf.append(ch)
-            else:
-                if buf:
-                    segments.append(("".join(buf), cur_font))
-                    buf = []
-                cur_font = want
-                buf.append(ch)
-        if buf:
-            segments.append(("".join(buf), cur_font))
+        for i, part in enumerate(_CJK_SPLIT.split(text)):
+            if part:
+                segments.append((part, cjk if i % 2 else base))
         return segments
 
+    def _metrics(
+        self, draw: ImageDraw.ImageDraw
+    ) -> Tuple[List[Tuple[str, ImageFont.ImageFont, int]], int, int]:
+        """Return (runs with advance widths, total width, line height).
+
+        Cached until the resolved base font (e.g. after scaling) or text changes.
+        """
+        base = self._font()
+        cached = self._runs_cache
+        if cached is not None and cached[0] is base and cached[1] == self.text:
+            return cached[2]
+        runs = [(s, f, int(f.getlength(s))) for s, f in self._segment_runs()]
+        total_w = sum(rw for _, _, rw in runs)
+        # Use font metrics (ascent+descent) to guarantee room for descenders
+        line_h = max((self._line_height(draw, f) for _, f, _ in runs), default=0)
+        metrics = (runs, total_w, line_h)
+        self._runs_cache = (base, self.text, metrics)
+        return metrics
+
     def _line_height(self, draw: ImageDraw.ImageDraw, font: ImageFont.ImageFont) -> int:
         try:
             asc, desc = font.getmetrics()
@@ -326,12 +352,8 @@ class TextWidget(Widget):
             return int(bb[3] - bb[1])
 
     def measure(self, draw: ImageDraw.ImageDraw, avail_w: int, avail_h: int) -> Tuple[int, int]:
-        runs = self._segment_runs()
+        runs, total_w, h = self._metrics(draw)
         if runs:
-            total_w = sum(int(f.getlength(s)) for s, f in runs)
-            # Use font metrics (ascent+descent) to guarantee room for descenders
-            heights = [self._line_height(draw, f) for _, f in runs]
-            h = max(heights) if heights else 0
             # Add a 1px safety pad to avoid AA clipping in tight boxes
             h_safe = h + 1 if h > 0 else 0
             return (min(total_w, avail_w), min(h_safe, avail_h))
@@ -343,8 +365,16 @@ class TextWidget(Widget):
             h_safe = h + 1 if h > 0 else 0
             return (min(w, avail_w), min(h_safe, avail_h))
 
+    def needs_clip(self, draw: ImageDraw.ImageDraw, w: int, h: int) -> bool:
+        # Text drawn inside a box that holds its measured size cannot bleed
+        # out; read the cached metrics rather than re-measuring
+        runs, total_w, lh = self._metrics(draw)
+        if not runs:
+            return False  # empty text paints nothing
+        return total_w > w or (lh + 1 if lh > 0 else 0) > h
+
     def render(self, draw: ImageDraw.ImageDraw, x: int, y: int, w: int, h: int) -> None:
-        runs = self._segment_runs()
+        runs, total_w, th = self._metrics(draw)
         if not runs:
             font = self._font()
             bbox = draw.textbbox((0, 0), self.text, font=font)
@@ -360,9 +390,6 @@ class TextWidget(Widget):
             draw.text((tx, ty), self.text, fill=self.fill, font=font)
             return
 
-        total_w = sum(int(f.getlength(s)) for s, f in runs)
-        th = max((self._line_height(draw, f) for _, f in runs), default=0)
-
         if self.align == "center":
             tx = x + (w - total_w) // 2
         elif self.align == "right":
@@ -372,6 +399,8 @@ class TextWidget(Widget):
         ty = y + (h - th) // 2
 
         cx = tx
-        for seg, fnt in runs:
-            draw.text((cx, ty), seg, fill=self.fill, font=fnt)
-            cx += int(fnt.getlength(seg))
+        draw_text = draw.text
+        fill = self.fill
+        for seg, fnt, seg_w in runs:
+            draw_text((cx, ty), seg, fill=fill, font=fnt)
+            cx += seg_w
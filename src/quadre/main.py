@@ -7,11 +7,28 @@ High-level functions for rendering dashboards from Python.
 
 import json
 import sys
+from typing import Any
 
 from quadre.flex.runner import render_dashboard_with_flex
 from quadre.flex.runner import build_dashboard_image
 from quadre.plugins import image_to_bytes
 
+try:  # Optional faster JSON parser; the stdlib remains the reference
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    _orjson = None
+
+
+def _loads(raw: bytes) -> Any:
+    if _orjson is not None:
+        try:
+            return _orjson.loads(raw)
+        except _orjson.JSONDecodeError:
+            # Stricter than the stdlib (NaN, big ints): defer to json for
+            # both the lenient cases and the reference error message
+            pass
+    return json.loads(raw)
+
 
 def render_dashboard(data: dict, out_path: str = "dashboard.png") -> str:
     """
@@ -63,8 +80,8 @@ def load_data_from_json(json_path: str) -> dict:
         SystemExit: If file not found, invalid JSON, or other error
     """
     try:
-        with open(json_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(json_path, "rb") as f:
+            return _loads(f.read())
     except FileNotFoundError:
         print(f"Error: File '{json_path}' not found.")
         sys.exit(1)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from io import BytesIO
 from pathlib import Path
 from typing import Any, Mapping
 
@@ -28,7 +27,11 @@ def file_plugin(image: Image.Image, ctx: OutputContext, cfg: Mapping[str, Any]):
     fmt = str(cfg.get("format") or ctx.format)
     save_kwargs = dict(cfg.get("save_kwargs") or {})
     _ensure_parent_dir(path)
-    image.save(path, format=fmt, **save_kwargs)
+    if save_kwargs:
+        image.save(path, format=fmt, **save_kwargs)
+    else:
+        # Default options: reuse the encoding other outputs may have produced
+        Path(path).write_bytes(ctx.encode(image, fmt))
     return path
 
 
@@ -40,9 +43,7 @@ def bytes_plugin(image: Image.Image, ctx: OutputContext, cfg: Mapping[str, Any])
       - format: output format (default: ctx.format)
     """
     fmt = str(cfg.get("format") or ctx.format)
-    buf = BytesIO()
-    image.save(buf, format=fmt)
-    return buf.getvalue()
+    return bytes(ctx.encode(image, fmt))
 
 
 # Register built-ins when module is imported via `quadre.plugins`
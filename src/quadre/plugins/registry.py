@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from io import BytesIO
 from typing import Any, Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 from PIL import Image
@@ -19,12 +20,33 @@ class OutputContext:
     - format: desired image format (e.g., "PNG")
     - doc: original dashboard document (for metadata or routing logic)
     - size: (width, height) of the rendered image
+    - encoded: encoded image buffers by format, shared by every output of one
+      dispatch so plugins asking for the same format encode only once
     """
 
     path: Optional[str]
     format: str
     doc: Mapping[str, Any]
     size: Tuple[int, int]
+    encoded: Optional[Dict[str, memoryview]] = field(default=None, repr=False, compare=False)
+
+    def encode(self, image: Image.Image, format: Optional[str] = None) -> memoryview:
+        """Return the image encoded with default save options (cached per format).
+
+        The result is a read-only view over the encoder's buffer, so neither
+        encoding nor cache hits copy the data; call bytes() on it when a
+        standalone bytes object is needed.
+        """
+        fmt = str(format or self.format).upper()
+        cache = self.encoded
+        if cache is not None and fmt in cache:
+            return cache[fmt]
+        buf = BytesIO()
+        image.save(buf, format=fmt)
+        data = buf.getbuffer().toreadonly()
+        if cache is not None:
+            cache[fmt] = data
+        return data
 
 
 _REGISTRY: MutableMapping[str, PluginFn] = {}
@@ -110,13 +132,15 @@ def dispatch_outputs(
 
     normalized = _normalize_outputs_spec(outputs_spec, default_path)
     results: List[Any] = []
+    encoded: Dict[str, memoryview] = {}
     for item in normalized:
         name = str(item.get("plugin", "file")).strip().lower()
         fmt = str(item.get("format") or _fmt_from_path(str(item.get("path") or default_path))).upper()
         ctx = OutputContext(path=str(item.get("path") or default_path) if (item.get("path") or default_path) else None,
                             format=fmt,
                             doc=doc,
-                            size=(w, h))
+                            size=(w, h),
+                            encoded=encoded)
         fn = get_plugin(name)
         # Pass the remaining keys (excluding 'plugin') as plugin config
         cfg = {k: v for k, v in item.items() if k != "plugin"}
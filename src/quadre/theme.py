@@ -21,7 +21,7 @@ Widgets can still override properties explicitly in layout nodes.
 import json
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from pydantic import BaseModel, Field, ConfigDict
 
@@ -162,6 +162,10 @@ def builtin_theme_path(name: str) -> Path:
     return here / f"{name}.json"
 
 
+# Last loaded theme keyed by (path, mtime_ns, size); reloaded when the file changes
+_CACHED_THEME: Optional[Tuple[Tuple[str, int, int], ThemeModel]] = None
+
+
 def load_theme_from_env_or_default() -> ThemeModel:
     """Load theme from quadre_THEME path or the bundled default; fail hard on error.
 
@@ -180,6 +184,15 @@ def load_theme_from_env_or_default() -> ThemeModel:
         if not candidate.exists():
             raise FileNotFoundError(f"Default theme file not found: {candidate}")
 
+    global _CACHED_THEME
+    try:
+        st = candidate.stat()
+        key = (str(candidate), st.st_mtime_ns, st.st_size)
+    except OSError:
+        key = None
+    if key is not None and _CACHED_THEME is not None and _CACHED_THEME[0] == key:
+        return _CACHED_THEME[1]
+
     try:
         raw = candidate.read_text(encoding="utf-8")
     except Exception as e:
@@ -196,7 +209,10 @@ def load_theme_from_env_or_default() -> ThemeModel:
         if isinstance(data.get("fonts"), dict):
             data["fonts"] = {str(k).lower(): v for k, v in data["fonts"].items()}
     # Will raise pydantic.ValidationError on schema issues
-    return ThemeModel.model_validate(data)
+    theme = ThemeModel.model_validate(data)
+    if key is not None:
+        _CACHED_THEME = (key, theme)
+    return theme
 
 
 def as_apply_theme_dict(theme: ThemeModel) -> Dict[str, Any]:
@@ -83,35 +83,31 @@ class SpacerComponent(BaseComponent):
     type: Literal["spacer"]
 
 
-class RowComponent(BaseComponent):
-    type: Literal["row"]
+class _ContainerComponent(BaseComponent):
     children: List["Component"]
 
     @model_validator(mode="after")
     def _non_empty_children(self):
         if not self.children:
-            raise ValueError("row requires non-empty 'children' list")
+            raise ValueError(f"{self.type} requires non-empty 'children' list")
         return self
 
 
-class ColumnComponent(BaseComponent):
-    type: Literal["column"]
-    children: List["Component"]
+class RowComponent(_ContainerComponent):
+    type: Literal["row"]
 
-    @model_validator(mode="after")
-    def _non_empty_children(self):
-        if not self.children:
-            raise ValueError("column requires non-empty 'children' list")
-        return self
+
+class ColumnComponent(_ContainerComponent):
+    type: Literal["column"]
 
 
-class GridComponent(BaseComponent):
+class GridComponent(_ContainerComponent):
     type: Literal["grid"]
-    children: List["Component"]
     properties: Dict[str, Any] | None = None
 
     @model_validator(mode="after")
-    def _require_cols(self):
+    def _non_empty_children(self):
+        # Columns are checked before children (replaces the shared check)
         cols = (self.properties or {}).get("columns")
         if not isinstance(cols, int) or cols <= 0:
             raise ValueError("grid.properties.columns must be a positive integer")
@@ -171,7 +167,8 @@ Component = Annotated[
 
 
 class CanvasModel(BaseModel):
-    model_config = ConfigDict(extra="ignore")
+    # Plain value object: immutable and hashable
+    model_config = ConfigDict(extra="ignore", frozen=True)
     height: str | int | None = None
     min_height: int | None = None
     max_height: int | None = None
@@ -186,33 +183,13 @@ class Document(BaseModel):
     layout: List[Component]
 
 
-def _post_validate_content_vs_props(
-    comp: BaseComponent, errors: List[str], path: str, warnings: List[str]
-) -> None:
-    props = comp.properties or {}
-    for bad in (
-        "text",
-        "title",
-        "date_note",
-        "value",
-        "delta",
-        "headers",
-        "rows",
-        "table",
-    ):
-        if bad in props:
-            errors.append(
-                f"{path}: Do not put content '{bad}' inside properties; use top-level field"
-            )
-    # color format hints
-    for color_key in ("fill", "color", "bg_fill", "bg_outline"):
-        if color_key in props and parse_color(props[color_key]) is None:
-            warnings.append(
-                f"{path}: property '{color_key}' is not a valid color; expected #rrggbb or [r,g,b]"
-            )
+# Content fields that must stay top-level (never inside properties)
+_CONTENT_KEYS = ("text", "title", "date_note", "value", "delta", "headers", "rows", "table")
+_COLOR_PROPS = ("fill", "color", "bg_fill", "bg_outline")
 
-    # warn on unknown properties (renderer may ignore them)
-    allowed = {
+# Known properties; anything else triggers an "unknown property" warning
+_ALLOWED_PROPS = frozenset(
+    {
         # container/layout styling
         "gap",
         "align_items",
@@ -245,7 +222,6 @@ def _post_validate_content_vs_props(
         "fill_height",
         "min_row_height",
         "max_row_height",
-        "fit",
         "shrink_row_height_floor",
         "style",
         # spacer
@@ -259,20 +235,128 @@ def _post_validate_content_vs_props(
         "margin_top",
         "margin_bottom",
     }
+)
+
+
+def _post_validate_content_vs_props(
+    comp: BaseComponent, errors: List[str], path: str, warnings: List[str]
+) -> None:
+    props = comp.properties or {}
+    if not props:
+        return
+    for bad in _CONTENT_KEYS:
+        if bad in props:
+            errors.append(
+                f"{path}: Do not put content '{bad}' inside properties; use top-level field"
+            )
+    # color format hints
+    for color_key in _COLOR_PROPS:
+        if color_key in props and parse_color(props[color_key]) is None:
+            warnings.append(
+                f"{path}: property '{color_key}' is not a valid color; expected #rrggbb or [r,g,b]"
+            )
+
+    # warn on unknown properties (renderer may ignore them)
     for k in props.keys():
-        lk = str(k).lower()
-        if (
-            lk not in allowed
-            and lk
-            not in {
-                # tolerances / legacy aliases possibly added in the future
-            }
-        ):
+        if str(k).lower() not in _ALLOWED_PROPS:
             warnings.append(
                 f"{path}: unknown property '{k}' may be ignored by renderer"
             )
 
 
+def _is_dataref_like(v: Any) -> bool:
+    return isinstance(v, dict) and any(k in v for k in ("ref", "$ref", "$"))
+
+
+def _validate_dref(
+    v: Any, field_path: str, ctx: Dict[str, Any] | None, errors: List[str], warnings: List[str]
+) -> None:
+    # v can be DataRef model or dict-like
+    ref_path = None
+    if isinstance(v, DataRef):
+        ref_path = v.path
+    elif _is_dataref_like(v):
+        ref_path = v.get("ref") or v.get("$ref") or v.get("$")
+    if ref_path is None:
+        return
+    if ctx is None:
+        warnings.append(
+            f"{field_path}: cannot validate DataRef target (missing top-level data)"
+        )
+        return
+    try:
+        resolved = resolve_path(ref_path, ctx)
+    except Exception:
+        resolved = None
+    if resolved is None:
+        errors.append(
+            f"{field_path}: DataRef '{ref_path}' does not resolve in 'data'"
+        )
+
+
+def _validate_table(
+    comp: "TableComponent", path: str, ctx: Dict[str, Any] | None, errors: List[str], warnings: List[str]
+) -> None:
+    payload = comp.table
+    headers = comp.headers
+    rows = comp.rows
+    if payload is not None:
+        if isinstance(payload, dict):
+            h = payload.get("headers", [])
+            r = payload.get("rows", [])
+            _validate_dref(h, f"{path}.table.headers", ctx, errors, warnings)
+            _validate_dref(r, f"{path}.table.rows", ctx, errors, warnings)
+            if not isinstance(h, list) or not isinstance(r, list):
+                errors.append(
+                    f"{path}: table.headers must be a list, table.rows must be a list"
+                )
+            else:
+                for i, row in enumerate(r):
+                    if not isinstance(row, list):
+                        errors.append(
+                            f"{path}: table rows must be lists (row {i})"
+                        )
+        elif isinstance(payload, list):
+            for i, row in enumerate(payload):
+                if not isinstance(row, list):
+                    errors.append(f"{path}: table rows must be lists (row {i})")
+        elif _is_dataref_like(payload):
+            _validate_dref(payload, f"{path}.table", ctx, errors, warnings)
+        else:
+            errors.append(
+                f"{path}: table payload must be dict with headers/rows, list-of-lists, or DataRef"
+            )
+    elif headers is not None or rows is not None:
+        h = headers or []
+        r = rows or []
+        _validate_dref(h, f"{path}.headers", ctx, errors, warnings)
+        _validate_dref(r, f"{path}.rows", ctx, errors, warnings)
+        if not isinstance(h, list) or not isinstance(r, list):
+            errors.append(
+                f"{path}: table.headers must be a list, table.rows must be a list"
+            )
+        else:
+            for i, row in enumerate(r):
+                if not isinstance(row, list):
+                    errors.append(f"{path}: table rows must be lists (row {i})")
+
+
+def _validate_content(
+    val: Any, field_path: str, ctx: Dict[str, Any] | None, errors: List[str], warnings: List[str]
+) -> None:
+    if isinstance(val, DataRef):
+        if ctx is None:
+            warnings.append(
+                f"{field_path}: cannot validate DataRef target (missing top-level data)"
+            )
+            return
+        resolved = resolve_path(val.path, ctx)
+        if resolved is None:
+            errors.append(
+                f"{field_path}: DataRef '{val.path}' does not resolve in 'data'"
+            )
+
+
 def validate_layout(doc: Dict[str, Any]) -> Tuple[List[str], List[str]]:
     errors: List[str] = []
     warnings: List[str] = []
@@ -324,99 +408,17 @@ def validate_layout(doc: Dict[str, Any]) -> Tuple[List[str], List[str]]:
         _post_validate_content_vs_props(comp, errors, path, warnings)
         # Deep checks for table payload structure
         if isinstance(comp, TableComponent):
-            payload = comp.table
-            headers = comp.headers
-            rows = comp.rows
-
-            def _is_dataref_like(v: Any) -> bool:
-                return isinstance(v, dict) and any(k in v for k in ("ref", "$ref", "$"))
-
-            def _validate_dref(v: Any, field_path: str) -> None:
-                # v can be DataRef model or dict-like
-                ref_path = None
-                if isinstance(v, DataRef):
-                    ref_path = v.path
-                elif _is_dataref_like(v):
-                    ref_path = v.get("ref") or v.get("$ref") or v.get("$")
-                if ref_path is None:
-                    return
-                if ctx is None:
-                    warnings.append(
-                        f"{field_path}: cannot validate DataRef target (missing top-level data)"
-                    )
-                    return
-                try:
-                    resolved = resolve_path(ref_path, ctx)
-                except Exception:
-                    resolved = None
-                if resolved is None:
-                    errors.append(
-                        f"{field_path}: DataRef '{ref_path}' does not resolve in 'data'"
-                    )
-
-            if payload is not None:
-                if isinstance(payload, dict):
-                    h = payload.get("headers", [])
-                    r = payload.get("rows", [])
-                    _validate_dref(h, f"{path}.table.headers")
-                    _validate_dref(r, f"{path}.table.rows")
-                    if not isinstance(h, list) or not isinstance(r, list):
-                        errors.append(
-                            f"{path}: table.headers must be a list, table.rows must be a list"
-                        )
-                    else:
-                        for i, row in enumerate(r):
-                            if not isinstance(row, list):
-                                errors.append(
-                                    f"{path}: table rows must be lists (row {i})"
-                                )
-                elif isinstance(payload, list):
-                    for i, row in enumerate(payload):
-                        if not isinstance(row, list):
-                            errors.append(f"{path}: table rows must be lists (row {i})")
-                elif _is_dataref_like(payload):
-                    _validate_dref(payload, f"{path}.table")
-                else:
-                    errors.append(
-                        f"{path}: table payload must be dict with headers/rows, list-of-lists, or DataRef"
-                    )
-            elif headers is not None or rows is not None:
-                h = headers or []
-                r = rows or []
-                _validate_dref(h, f"{path}.headers")
-                _validate_dref(r, f"{path}.rows")
-                if not isinstance(h, list) or not isinstance(r, list):
-                    errors.append(
-                        f"{path}: table.headers must be a list, table.rows must be a list"
-                    )
-                else:
-                    for i, row in enumerate(r):
-                        if not isinstance(row, list):
-                            errors.append(f"{path}: table rows must be lists (row {i})")
-
+            _validate_table(comp, path, ctx, errors, warnings)
         # DataRef existence checks for other components
-        def _validate_content(val: Any, field_path: str) -> None:
-            if isinstance(val, DataRef):
-                if ctx is None:
-                    warnings.append(
-                        f"{field_path}: cannot validate DataRef target (missing top-level data)"
-                    )
-                    return
-                resolved = resolve_path(val.path, ctx)
-                if resolved is None:
-                    errors.append(
-                        f"{field_path}: DataRef '{val.path}' does not resolve in 'data'"
-                    )
-
-        if isinstance(comp, TitleComponent):
-            _validate_content(comp.title, f"{path}.title")
+        elif isinstance(comp, TitleComponent):
+            _validate_content(comp.title, f"{path}.title", ctx, errors, warnings)
             if comp.date_note is not None:
-                _validate_content(comp.date_note, f"{path}.date_note")
+                _validate_content(comp.date_note, f"{path}.date_note", ctx, errors, warnings)
         elif isinstance(comp, TextComponent):
-            _validate_content(comp.text, f"{path}.text")
+            _validate_content(comp.text, f"{path}.text", ctx, errors, warnings)
         elif isinstance(comp, KPIComponent):
-            _validate_content(comp.title, f"{path}.title")
-            _validate_content(comp.value, f"{path}.value")
+            _validate_content(comp.title, f"{path}.title", ctx, errors, warnings)
+            _validate_content(comp.value, f"{path}.value", ctx, errors, warnings)
             # delta can be DataRef-like dict; best-effort check
             # (skip strict validation here if not DataRef model)
         # Forbid legacy data_ref entirely
@@ -424,9 +426,8 @@ def validate_layout(doc: Dict[str, Any]) -> Tuple[List[str], List[str]]:
             errors.append(
                 f"{path}: 'data_ref' is no longer supported; use explicit content fields"
             )
-        if isinstance(comp, (RowComponent, ColumnComponent, GridComponent)):
-            children = getattr(comp, "children", [])
-            for i, ch in enumerate(children):
+        if isinstance(comp, _ContainerComponent):
+            for i, ch in enumerate(comp.children):
                 walk(ch, f"{path}.children[{i}]")
 
     for i, comp in enumerate(parsed.layout):
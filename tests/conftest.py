@@ -1,30 +1,55 @@
 import hashlib
+from functools import lru_cache
+
 import pytest
 from PIL import ImageFont
 
 
-@pytest.fixture(autouse=True)
+_FONT_NAMES = ("H1", "H2", "NUMBER", "BODY", "TABLE", "SMALL", "BOLD_SMALL")
+
+
+@lru_cache(maxsize=1)
+def _default_font():
+    return ImageFont.load_default()
+
+
+def _patch_default_fonts(mp: pytest.MonkeyPatch) -> None:
+    from quadre.components.config import FONTS
+
+    # FONTS is imported by name across modules, so patch its attributes
+    # rather than swapping the object; the default font is loaded once.
+    default = _default_font()
+    for name in _FONT_NAMES:
+        mp.setattr(FONTS, name, default, raising=False)
+
+
+@pytest.fixture
 def force_default_fonts(monkeypatch):
-    """Force deterministic default fonts across tests.
+    """Force deterministic default fonts in tests that measure or render text.
 
     This avoids cross-platform font differences impacting rendering output.
+    Opt in per module with ``pytestmark = pytest.mark.usefixtures(...)``.
     """
-    from quadre.components.config import FONTS
-
-    default = ImageFont.load_default()
-    monkeypatch.setattr(FONTS, "H1", default, raising=False)
-    monkeypatch.setattr(FONTS, "H2", default, raising=False)
-    monkeypatch.setattr(FONTS, "NUMBER", default, raising=False)
-    monkeypatch.setattr(FONTS, "BODY", default, raising=False)
-    monkeypatch.setattr(FONTS, "TABLE", default, raising=False)
-    monkeypatch.setattr(FONTS, "SMALL", default, raising=False)
-    monkeypatch.setattr(FONTS, "BOLD_SMALL", default, raising=False)
+    _patch_default_fonts(monkeypatch)
     yield
 
 
+@pytest.fixture(scope="session")
+def render_with_default_fonts():
+    """Return a build_dashboard_image wrapper that forces default fonts.
+
+    For session-scoped fixtures, which cannot use ``force_default_fonts``.
+    """
+    from quadre.flex.runner import build_dashboard_image
+
+    def _render(data):
+        with pytest.MonkeyPatch.context() as mp:
+            _patch_default_fonts(mp)
+            return build_dashboard_image(data)
+
+    return _render
+
+
 def sha256_file(path: str) -> str:
-    h = hashlib.sha256()
     with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
-    return h.hexdigest()
+        return hashlib.file_digest(f, "sha256").hexdigest()
@@ -9,16 +9,13 @@ import pytest
 
 from quadre.flex.runner import render_dashboard_with_flex
 
-
-pytestmark = pytest.mark.pixels
+# Text metrics must not depend on the fonts installed on the host
+pytestmark = [pytest.mark.pixels, pytest.mark.usefixtures("force_default_fonts")]
 
 
 def sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
     with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
-    return h.hexdigest()
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
 
 def load_baselines(file: Path) -> dict:
@@ -35,11 +32,20 @@ def save_baselines(file: Path, data: dict) -> None:
     file.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
 
 
+BASELINE_FILE = Path("tests/baselines/deterministic.json")
+
+
+@pytest.fixture(scope="session")
+def baselines() -> dict:
+    """Baseline digests, read once per session (recording updates it in place)."""
+    return load_baselines(BASELINE_FILE)
+
+
 @pytest.mark.skipif(
     os.environ.get("quadre_PIXELS") != "1",
     reason="set quadre_PIXELS=1 to enable pixel tests",
 )
-def test_pixels_kpi_row_deterministic(tmp_path: Path):
+def test_pixels_kpi_row_deterministic(tmp_path: Path, baselines: dict):
     # Minimal deterministic scenario (fonts forced by conftest fixture)
     doc = {
         "canvas": {"height": "auto", "min_height": 320, "max_height": 320},
@@ -70,14 +76,11 @@ def test_pixels_kpi_row_deterministic(tmp_path: Path):
     render_dashboard_with_flex(doc, str(out))
     digest = sha256_file(out)
 
-    # Baseline store
-    baseline_file = Path("tests/baselines/deterministic.json")
-    baselines = load_baselines(baseline_file)
     key = "kpi_row_v1"
 
     if os.environ.get("quadre_RECORD") == "1":
         baselines[key] = digest
-        save_baselines(baseline_file, baselines)
+        save_baselines(BASELINE_FILE, baselines)
         pytest.skip("Recorded baseline; skipping assertion")
 
     assert key in baselines, "Baseline missing — set quadre_RECORD=1 to record"
@@ -80,6 +80,11 @@ def test_email_plugin_sends_with_starttls_by_default(monkeypatch):
     # attachment subtype should match ctx/format (PNG)
     atts = list(msg.iter_attachments())
     assert atts and atts[0].get_content_type() == "image/png"
+    # attachment decodes back to the encoded image
+    import io
+
+    decoded = PILImage.open(io.BytesIO(atts[0].get_content()))
+    assert decoded.format == "PNG" and decoded.size == img.size
 
 
 def test_email_plugin_uses_smtps_when_use_ssl(monkeypatch):
@@ -262,3 +267,103 @@ def test_email_plugin_inline_custom_html_with_placeholder(monkeypatch):
             match_found = True
             break
     assert match_found
+
+
+@pytest.mark.parametrize("cid", [None, "<img1@example.com>"])
+def test_image_part_matches_content_manager_and_round_trips(cid):
+    from email import message_from_bytes, policy
+    from email.message import EmailMessage
+
+    from quadre.plugins.email import _image_part
+
+    payload = os.urandom(5000)
+    part = _image_part(memoryview(payload), "png", "dash.png", cid)
+
+    # Same headers as the content manager would have written
+    ref = EmailMessage()
+    ref.set_content(payload, maintype="image", subtype="png",
+                    disposition="attachment", filename="dash.png", cid=cid)
+    for name in ("Content-Type", "Content-Transfer-Encoding", "Content-Disposition", "Content-ID"):
+        assert part.get(name) == ref.get(name)
+
+    # The payload survives serialization and parsing unchanged
+    msg = EmailMessage()
+    msg.set_content("body")
+    msg.make_mixed()
+    msg.attach(part)
+    parsed = message_from_bytes(msg.as_bytes(), policy=policy.default)
+    (att,) = [p for p in parsed.walk() if p.get_content_maintype() == "image"]
+    assert att.get_filename() == "dash.png"
+    assert att.get("Content-ID") == cid
+    assert att.get_content() == payload
+
+
+def test_email_plugin_reuses_bytes_encoded_by_other_outputs(monkeypatch):
+    dummy = _DummySMTP("", 0)
+
+    def _smtp(host, port, timeout=None):
+        nonlocal dummy
+        dummy = _DummySMTP(host, port, timeout)
+        return dummy
+
+    import smtplib
+
+    monkeypatch.setattr(smtplib, "SMTP", _smtp)
+
+    from quadre.plugins import dispatch_outputs
+
+    saves = []
+    real_save = PILImage.Image.save
+
+    def _counting_save(self, fp, format=None, **params):
+        saves.append(format)
+        return real_save(self, fp, format=format, **params)
+
+    monkeypatch.setattr(PILImage.Image, "save", _counting_save)
+
+    img = _make_img()
+    outputs = [
+        {"plugin": "bytes", "format": "PNG"},
+        {"plugin": "email", "host": "smtp.example.com", "to": "a@example.com", "format": "PNG"},
+    ]
+    encoded, _ = dispatch_outputs(img, outputs, default_path=None, doc={})
+
+    # The bytes plugin hands out a real bytes object, not the shared view
+    assert type(encoded) is bytes
+    atts = list(dummy.sent.iter_attachments())
+    assert atts[0].get_content() == encoded
+    assert saves == ["PNG"]
+
+
+def test_email_plugin_keep_alive_reuses_connection(monkeypatch):
+    class _PooledSMTP(_DummySMTP):
+        def noop(self):
+            return (250, b"OK")
+
+        def quit(self):
+            pass
+
+    created = []
+
+    def _smtp(host, port, timeout=None):
+        conn = _PooledSMTP(host, port, timeout)
+        created.append(conn)
+        return conn
+
+    import smtplib
+    from quadre.plugins import email as email_mod
+
+    monkeypatch.setattr(smtplib, "SMTP", _smtp)
+    monkeypatch.setattr(email_mod, "_SMTP_POOL", {})
+
+    cfg = {"host": "smtp.example.com", "to": "a@example.com", "keep_alive": True}
+    email_plugin(_make_img(), _make_ctx(), cfg)
+    email_plugin(_make_img(), _make_ctx(), cfg)
+
+    assert len(created) == 1
+    assert created[0].started_tls is True
+    assert created[0].sent is not None
+
+    # A different timeout needs its own connection
+    email_plugin(_make_img(), _make_ctx(), {**cfg, "timeout": 5})
+    assert len(created) == 2 and created[1].timeout == 5.0
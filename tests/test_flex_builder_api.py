@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import pytest
+
 from quadre.flex import Text, KPI, Row, Title, dref, make_doc
 from quadre.validator import validate_layout
 from quadre.flex.runner import build_dashboard_image
 from quadre.components.config import DIMENSIONS
 
+# Text metrics must not depend on the fonts installed on the host
+pytestmark = pytest.mark.usefixtures("force_default_fonts")
+
 
 def test_typed_builder_validates_and_renders():
     doc = make_doc(
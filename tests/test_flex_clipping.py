@@ -1,11 +1,25 @@
 from __future__ import annotations
 
+import pytest
 from PIL import Image, ImageDraw
 
 from quadre.flex.engine import Widget, FlexContainer
 from quadre.components import COLORS
 
 
+CANVAS_SIZE = (200, 50)
+
+
+@pytest.fixture(scope="module")
+def canvas():
+    # One backing image for the module; each test clears it before rendering
+    img = Image.new("RGB", CANVAS_SIZE, COLORS.BACKGROUND)
+    draw = ImageDraw.Draw(img)
+    # Enable per-child clipping via the backing image handle
+    setattr(draw, "_quadre_image", img)
+    return img, draw
+
+
 class LeftRed(Widget):
     def measure(self, draw: ImageDraw.ImageDraw, avail_w: int, avail_h: int):
         return (80, 40)
@@ -24,28 +38,133 @@ class RightGreenOverdraw(Widget):
         draw.rectangle((x - 30, y, x + w, y + h), fill=(0, 255, 0))
 
 
-def test_row_children_are_clipped_to_bounds():
+def test_row_children_are_clipped_to_bounds(canvas):
     cont = FlexContainer(direction="row", gap=0, padding=0, align_items="stretch")
     cont.add(LeftRed())
     cont.add(RightGreenOverdraw())
 
-    W, H = 200, 50
-    img = Image.new("RGB", (W, H), COLORS.BACKGROUND)
-    draw = ImageDraw.Draw(img)
-    # Enable per-child clipping via the backing image handle
-    setattr(draw, "_quadre_image", img)
+    img, draw = canvas
+    W, H = img.size
+    draw.rectangle((0, 0, W, H), fill=COLORS.BACKGROUND)
 
     cont.render(draw, 0, 0, W, H)
 
     mid_y = H // 2
+    # Fetch the middle scanline once as raw RGB bytes (3 bytes per pixel)
+    row = img.crop((0, mid_y, W, mid_y + 1)).tobytes()
 
     # Near the right edge of the first child's box: should remain red (no green bleed)
     px1 = 80 - 5
-    r1, g1, b1 = img.getpixel((px1, mid_y))
+    r1, g1, b1 = row[3 * px1 : 3 * px1 + 3]
     assert r1 > 200 and g1 < 50, "expected red near first child's edge without bleed"
 
     # Inside the second child's box: should be green
     px2 = 80 + 5
-    r2, g2, b2 = img.getpixel((px2, mid_y))
+    r2, g2, b2 = row[3 * px2 : 3 * px2 + 3]
     assert g2 > 200 and r2 < 50, "expected green inside second child's area"
 
+
+class Blank(Widget):
+    def measure(self, draw: ImageDraw.ImageDraw, avail_w: int, avail_h: int):
+        return (80, 40)
+
+    def render(self, draw: ImageDraw.ImageDraw, x: int, y: int, w: int, h: int):
+        pass
+
+
+def test_reused_clip_layers_start_transparent(canvas):
+    # Same-sized siblings share pooled layers; a blank child must not
+    # inherit the previous child's pixels.
+    cont = FlexContainer(direction="row", gap=0, padding=0, align_items="stretch")
+    cont.add(LeftRed())
+    cont.add(Blank())
+
+    img, draw = canvas
+    draw.rectangle((0, 0, *img.size), fill=(255, 255, 255))
+
+    cont.render(draw, 0, 0, 160, 40)
+
+    assert img.getpixel((10, 20)) == (255, 0, 0)
+    assert img.getpixel((120, 20)) == (255, 255, 255)
+
+
+def test_needs_clip_for_simple_widgets_and_plain_containers():
+    from quadre.flex.engine import FixedBox
+
+    draw = ImageDraw.Draw(Image.new("RGB", (10, 10)))
+    assert FixedBox(20, 20).needs_clip(draw, 20, 20) is False
+
+    plain = FlexContainer(direction="row", gap=0, padding=0)
+    plain.add(FixedBox(40, 20))
+    assert plain.needs_clip(draw, 50, 20) is False
+    # Overflowing children are clipped by render() itself, so the answer
+    # does not depend on the content
+    plain.children[0].shrink = 0.0
+    assert plain.needs_clip(draw, 30, 20) is False
+
+    boxed = FlexContainer(direction="row", bg_fill=(255, 255, 255))
+    assert boxed.needs_clip(draw, 50, 20) is True
+
+
+def test_plain_container_clips_overflowing_children_to_its_box(canvas):
+    inner = FlexContainer(direction="row", gap=0, padding=0)
+    inner.add(LeftRed(), shrink=0.0)
+
+    img, draw = canvas
+    draw.rectangle((0, 0, *img.size), fill=(255, 255, 255))
+
+    # The 80px child overflows the 50px container; nothing may paint past it
+    inner.render(draw, 0, 0, 50, 40)
+
+    assert img.getpixel((45, 20)) == (255, 0, 0)
+    assert img.getpixel((60, 20)) == (255, 255, 255)
+
+
+def test_shadow_sprite_cache_is_bounded_by_pixel_area(monkeypatch):
+    from quadre.flex import engine
+
+    monkeypatch.setattr(engine, "_SHADOW_CACHE", engine.OrderedDict())
+    monkeypatch.setattr(engine, "_shadow_cache_area", 0)
+    monkeypatch.setattr(engine, "_SHADOW_CACHE_PIXELS", 10_000)
+
+    first = engine._shadow_sprite(50, 50, 4, 40, 0)
+    assert engine._shadow_sprite(50, 50, 4, 40, 0) is first
+    for w in (60, 70, 80):
+        engine._shadow_sprite(w, 50, 4, 40, 0)
+    # Oldest sprites are evicted once the budget is exceeded
+    assert engine._shadow_cache_area <= 10_000
+    assert (50, 50, 4, 40, 0) not in engine._SHADOW_CACHE
+    # A sprite over the whole budget is built but never cached
+    engine._shadow_sprite(200, 200, 4, 40, 0)
+    assert (200, 200, 4, 40, 0) not in engine._SHADOW_CACHE
+
+
+@pytest.mark.parametrize(
+    "box, width", [((0, 20), 200), ((20, 0), 200), ((300, 20), 0)]
+)
+def test_zero_size_rects_render_without_error(canvas, box, width):
+    from quadre.flex.engine import FixedBox, FlexItem
+
+    # Pillow rejects rectangles whose far corner precedes the near one
+    img, draw = canvas
+    cont = FlexContainer(direction="row", children=[FlexItem(FixedBox(*box))])
+    cont.render(draw, 0, 0, width, 40)
+
+
+def test_empty_rect_children_skip_clip_layers(monkeypatch):
+    from quadre.flex import engine
+    from quadre.flex.engine import FixedBox
+
+    def _fail(draw, w, h):
+        raise AssertionError(f"clip layer allocated for an empty child ({w}x{h})")
+
+    monkeypatch.setattr(engine, "_acquire_layer", _fail)
+    img = Image.new("RGB", (200, 100), (255, 255, 255))
+    draw = ImageDraw.Draw(img)
+    setattr(draw, "_quadre_image", img)
+
+    cont = FlexContainer(direction="column", gap=0, padding=0)
+    cont.add(FixedBox(50, 0))
+    cont.add(FixedBox(50, 40))
+    cont.render(draw, 0, 0, 200, 100)
+    assert img.getpixel((10, 10)) != (255, 255, 255)
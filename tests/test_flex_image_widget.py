@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from PIL import Image, ImageDraw
+
+from quadre.flex.widgets import ImageWidget
+
+
+def test_image_measure_reads_source_once(tmp_path):
+    src = tmp_path / "logo.png"
+    Image.new("RGB", (40, 20), (255, 0, 0)).save(src)
+    draw = ImageDraw.Draw(Image.new("RGB", (10, 10)))
+
+    w = ImageWidget(src=str(src))
+    assert w.measure(draw, 100, 100) == (100, 50)
+
+    # The natural size is cached; later passes do not touch the file
+    src.unlink()
+    assert w.measure(draw, 60, 100) == (60, 30)
+
+
+def test_image_measure_missing_source_collapses_height(tmp_path):
+    draw = ImageDraw.Draw(Image.new("RGB", (10, 10)))
+    w = ImageWidget(src=str(tmp_path / "missing.png"))
+    assert w.measure(draw, 100, 100) == (100, 0)
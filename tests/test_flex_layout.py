@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from PIL import Image, ImageDraw
+
+from quadre.flex.engine import FixedBox, FlexContainer
+
+
+def _draw(w: int, h: int) -> ImageDraw.ImageDraw:
+    return ImageDraw.Draw(Image.new("RGB", (w, h), (255, 255, 255)))
+
+
+def test_grow_distributes_every_free_pixel():
+    cont = FlexContainer(direction="row", gap=0, padding=0)
+    for _ in range(3):
+        cont.add(FixedBox(10, 10), grow=1.0)
+
+    rects = cont._layout(_draw(101, 10), 0, 0, 101, 10)
+
+    widths = [r[2] for r in rects]
+    assert sum(widths) == 101
+    assert max(widths) - min(widths) <= 1
+    # Children are laid out edge to edge
+    assert rects[-1][0] + rects[-1][2] == 101
+
+
+def test_shrink_removes_exact_deficit():
+    cont = FlexContainer(direction="row", gap=0, padding=0)
+    for _ in range(3):
+        cont.add(FixedBox(50, 10))
+
+    rects = cont._layout(_draw(100, 10), 0, 0, 100, 10)
+
+    assert sum(r[2] for r in rects) == 100
+
+
+def test_justify_offsets_and_gaps():
+    from quadre.flex.engine import _justify
+
+    assert _justify("start", 30, 10, 3) == (0, 10)
+    assert _justify("center", 30, 10, 3) == (15, 10)
+    assert _justify("end", 30, 10, 3) == (30, 10)
+    assert _justify("space-between", 30, 10, 3) == (0, 25)
+    assert _justify("space-around", 30, 10, 3) == (10, 20)
+    assert _justify("space-evenly", 30, 10, 3) == (17, 17)
+    # Spacing modes fall back to start with a single item
+    assert _justify("space-between", 30, 10, 1) == (0, 10)
+
+
+def test_layout_skips_measure_for_fixed_stretched_children():
+    calls = []
+
+    class Counting(FixedBox):
+        def measure(self, draw, avail_w, avail_h):
+            calls.append((avail_w, avail_h))
+            return super().measure(draw, avail_w, avail_h)
+
+    cont = FlexContainer(direction="column", gap=0, padding=0, align_items="stretch")
+    cont.add(Counting(10, 10), basis=30)
+
+    rects = cont._layout(_draw(50, 100), 0, 0, 50, 100)
+
+    assert rects == [(0, 0, 50, 30)]
+    assert calls == []
+
+
+def test_column_stack_places_children_and_shrinks_on_overflow():
+    cont = FlexContainer(direction="column", gap=5, padding=0, align_items="stretch")
+    for _ in range(3):
+        cont.add(FixedBox(10, 30))
+
+    rects = cont._layout(_draw(40, 200), 0, 0, 40, 200)
+    assert rects == [(0, 0, 40, 30), (0, 35, 40, 30), (0, 70, 40, 30)]
+
+    tight = cont._layout(_draw(40, 70), 0, 0, 40, 70)
+    assert sum(r[3] for r in tight) + 2 * 5 == 70
+
+
+def test_static_row_aligns_children_on_cross_axis():
+    cont = FlexContainer(direction="row", gap=4, padding=2, align_items="center")
+    cont.add(FixedBox(10, 10), grow=0.0)
+    cont.add(FixedBox(20, 30), grow=0.0)
+    cont.children[1].align_self = "end"
+
+    rects = cont._layout(_draw(100, 44), 0, 0, 100, 44)
+    assert rects == [(2, 17, 10, 10), (16, 12, 20, 30)]
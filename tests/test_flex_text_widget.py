@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import pytest
+from PIL import Image, ImageDraw, ImageFont
+
+from quadre.components import FONTS
+from quadre.flex.widgets import TextWidget
+
+# Text metrics must not depend on the fonts installed on the host
+pytestmark = pytest.mark.usefixtures("force_default_fonts")
+
+
+def _draw() -> ImageDraw.ImageDraw:
+    return ImageDraw.Draw(Image.new("RGB", (10, 10)))
+
+
+def test_text_measure_follows_font_changes(monkeypatch):
+    w = TextWidget("Revenue 2024", font_key="body")
+    small = w.measure(_draw(), 10_000, 10_000)
+    assert w.measure(_draw(), 10_000, 10_000) == small
+
+    monkeypatch.setattr(FONTS, "BODY", ImageFont.load_default(size=40))
+    large = w.measure(_draw(), 10_000, 10_000)
+    assert large[0] > small[0]
+    assert large[1] > small[1]
+
+
+def test_text_measure_follows_text_changes():
+    w = TextWidget("ab", font_key="body")
+    short = w.measure(_draw(), 10_000, 10_000)
+    w.text = "abcdef"
+    assert w.measure(_draw(), 10_000, 10_000)[0] > short[0]
+
+
+def test_cjk_runs_cover_all_ranges(monkeypatch):
+    cjk = ImageFont.load_default()
+    monkeypatch.setattr(TextWidget, "_cjk_font", lambda self: cjk)
+
+    # Unified, Extension A and Compatibility ideographs all use the CJK font
+    for ch in ("中", "㐀", "﫿"):
+        runs = TextWidget(f"ab{ch}cd", font_key="body")._segment_runs()
+        assert [s for s, _ in runs] == ["ab", ch, "cd"]
+        assert runs[1][1] is cjk and runs[0][1] is not cjk
+
+    # Non-BMP characters stay with the base font
+    runs = TextWidget("a\U0001F600", font_key="body")._segment_runs()
+    assert len(runs) == 1 and runs[0][1] is not cjk
+
+    runs = TextWidget("ab中文cd")._segment_runs()
+    assert [s for s, _ in runs] == ["ab", "中文", "cd"]
+
+
+def test_ascii_text_skips_cjk_fallback(monkeypatch):
+    def _fail(self):
+        raise AssertionError("CJK fallback resolved for ASCII text")
+
+    monkeypatch.setattr(TextWidget, "_cjk_font", _fail)
+    w = TextWidget("Revenue 2024", font_key="body")
+    assert [s for s, _ in w._segment_runs()] == ["Revenue 2024"]
+    assert TextWidget("", font_key="body")._segment_runs() == []
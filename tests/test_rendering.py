@@ -1,51 +1,45 @@
 from __future__ import annotations
 
-from pathlib import Path
-import hashlib
+import pytest
 
 from PIL import Image
 
-from quadre.flex.runner import render_dashboard_with_flex
+from quadre.flex.runner import build_dashboard_image, render_dashboard_with_flex
 from quadre.components.config import DIMENSIONS
 
+# Text metrics must not depend on the fonts installed on the host
+pytestmark = pytest.mark.usefixtures("force_default_fonts")
 
-def _hash_png(path: Path) -> str:
-    h = hashlib.sha256()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
-    return h.hexdigest()
 
+BASE_DATA = {
+    "title": "Test Dashboard",
+    "date_note": "Unit",
+    "top_kpis": [
+        {"title": "A", "value": "1", "delta": {"pct": 1}},
+        {"title": "B", "value": "2"},
+    ],
+    "platform_rows": [
+        ["Platform", "Value"],
+        ["Web", "1"],
+        ["iOS", "2"],
+        ["Android", "3"],
+    ],
+    "canvas": {"height": "auto", "min_height": 600, "max_height": 1600},
+}
 
-def test_flex_basic_render_is_deterministic(tmp_path):
-    data = {
-        "title": "Test Dashboard",
-        "date_note": "Unit",
-        "top_kpis": [
-            {"title": "A", "value": "1", "delta": {"pct": 1}},
-            {"title": "B", "value": "2"},
-        ],
-        "platform_rows": [
-            ["Platform", "Value"],
-            ["Web", "1"],
-            ["iOS", "2"],
-            ["Android", "3"],
-        ],
-        "canvas": {"height": "auto", "min_height": 600, "max_height": 1600},
-    }
 
-    out1 = tmp_path / "render1.png"
-    out2 = tmp_path / "render2.png"
+@pytest.fixture(scope="session")
+def base_image(render_with_default_fonts):
+    # Rendered once per session; tests compare fresh renders against it
+    return render_with_default_fonts(BASE_DATA)
 
-    render_dashboard_with_flex(data, str(out1))
-    render_dashboard_with_flex(data, str(out2))
 
-    # Both files exist and are identical
-    assert out1.exists() and out2.exists()
-    assert _hash_png(out1) == _hash_png(out2)
+def test_flex_basic_render_is_deterministic(base_image):
+    im = build_dashboard_image(BASE_DATA)
+    assert im.size == base_image.size
+    assert im.tobytes() == base_image.tobytes()
 
     # Dimensions sane
-    im = Image.open(out1)
     w, h = im.size
     assert w == DIMENSIONS.WIDTH
     assert h >= 600 and h <= 1600
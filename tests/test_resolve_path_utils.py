@@ -3,11 +3,16 @@ from __future__ import annotations
 from quadre.utils.dataref import resolve_path
 
 
+# Shared read-only fixtures (plain dicts: resolve_path only walks real dicts)
+NESTED_DATA = {
+    "a": {"b": [{"c": 1}, {"c": 2}]},
+    "arr": [10, 20, 30],
+}
+FLAT_DATA = {"x": 42}
+
+
 def test_resolve_path_basic_and_indexing():
-    data = {
-        "a": {"b": [{"c": 1}, {"c": 2}]},
-        "arr": [10, 20, 30],
-    }
+    data = NESTED_DATA
 
     assert resolve_path("$.a.b[0].c", data) == 1
     assert resolve_path("$.a.b[1].c", data) == 2
@@ -15,7 +20,7 @@ def test_resolve_path_basic_and_indexing():
 
 
 def test_resolve_path_root_and_dot_prefix():
-    data = {"x": 42}
+    data = FLAT_DATA
 
     # '$' alone returns the whole data
     assert resolve_path("$", data) == data
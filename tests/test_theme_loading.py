@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+import json
+
+from quadre.theme import load_theme_from_env_or_default
+
+
+def test_theme_is_reused_until_file_changes(tmp_path, monkeypatch):
+    path = tmp_path / "theme.json"
+    path.write_text(json.dumps({"fonts": {"h1": 40}}), encoding="utf-8")
+    monkeypatch.setenv("quadre_THEME", str(path))
+
+    first = load_theme_from_env_or_default()
+    assert load_theme_from_env_or_default() is first
+
+    path.write_text(json.dumps({"fonts": {"h1": 400}}), encoding="utf-8")
+    changed = load_theme_from_env_or_default()
+    assert changed is not first
+    assert changed.fonts.h1 == 400
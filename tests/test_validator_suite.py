@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import pytest
+
 from quadre.validator import validate_layout
 
 
 def _has_error(errors: list[str], snippet: str) -> bool:
-    return any(snippet in e for e in errors)
+    # One substring scan over the joined messages; NUL keeps matches per message
+    return snippet in "\x00".join(errors)
 
 
 def _has_warn(warns: list[str], snippet: str) -> bool:
-    return any(snippet in w for w in warns)
+    return snippet in "\x00".join(warns)
 
 
 def test_valid_minimal_text():
@@ -71,11 +74,14 @@ def test_table_payload_type_errors():
     assert _has_error(errors, "table rows must be lists")
 
 
-def test_dataref_aliases_and_path():
-    for key in ("ref", "$", "$ref"):
-        doc = {"layout": [{"type": "text", "text": {key: "$.x"}}]}
-        errors, _ = validate_layout(doc)
-        assert errors == []
+@pytest.mark.parametrize("key", ["ref", "$", "$ref"])
+def test_dataref_aliases(key):
+    doc = {"layout": [{"type": "text", "text": {key: "$.x"}}]}
+    errors, _ = validate_layout(doc)
+    assert errors == []
+
+
+def test_dataref_path():
     # invalid path
     doc_bad = {"layout": [{"type": "text", "text": {"$": "x"}}]}
     errors, _ = validate_layout(doc_bad)
@@ -100,11 +106,11 @@ def test_grid_requires_columns_and_children():
     assert _has_error(errors, "grid requires non-empty 'children' list")
 
 
-def test_row_column_children_required():
-    for t in ("row", "column"):
-        doc = {"layout": [{"type": t, "children": []}]}
-        errors, _ = validate_layout(doc)
-        assert _has_error(errors, f"{t} requires non-empty 'children' list")
+@pytest.mark.parametrize("t", ["row", "column"])
+def test_row_column_children_required(t):
+    doc = {"layout": [{"type": t, "children": []}]}
+    errors, _ = validate_layout(doc)
+    assert _has_error(errors, f"{t} requires non-empty 'children' list")
 
 
 def test_properties_must_not_contain_content():
@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import ast
 import os
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Set, Tuple
@@ -29,10 +30,15 @@ TESTS = ROOT / "tests"
 
 
 def iter_py_files(base: Path) -> Iterable[Path]:
-    for dirpath, _dirnames, filenames in os.walk(base):
-        for fn in filenames:
-            if fn.endswith(".py"):
-                yield Path(dirpath) / fn
+    # scandir entries carry their type from the directory listing, so no stat
+    stack = [str(base)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".py") and entry.is_file(follow_symlinks=False):
+                    yield Path(entry.path)
 
 
 def module_name_for(path: Path) -> Optional[str]:
@@ -46,7 +52,7 @@ def module_name_for(path: Path) -> Optional[str]:
     return ".".join(parts)
 
 
-@dataclass
+@dataclass(slots=True)
 class Symbol:
     kind: str  # 'func' | 'class' | 'method'
     module: str
@@ -55,91 +61,103 @@ class Symbol:
     lineno: int
 
 
-class CollectUses(ast.NodeVisitor):
-    def __init__(self) -> None:
-        self.names: Set[str] = set()
-        self.attrs: Set[str] = set()
-
-    def visit_Name(self, node: ast.Name) -> None:  # noqa: N802
-        self.names.add(node.id)
-        self.generic_visit(node)
+class CollectAll:
+    """Collect definitions, name/attribute usages and imports of one file.
 
-    def visit_Attribute(self, node: ast.Attribute) -> None:  # noqa: N802
-        # Record attribute name usage (e.g., module.func, obj.method)
-        self.attrs.add(node.attr)
-        self.generic_visit(node)
+    Definitions are only recorded when a module name is given (files in src/).
+    """
 
-
-class CollectDefs(ast.NodeVisitor):
-    def __init__(self, module: str, filepath: Path) -> None:
-        self.module = module
+    def __init__(self, module: Optional[str], filepath: Path) -> None:
+        # One shared string for every Symbol of this module
+        self.module = sys.intern(module) if module else module
         self.filepath = filepath
+        # definitions
         self.symbols: List[Symbol] = []
-        self._class_stack: List[str] = []
-
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:  # noqa: N802
-        self.symbols.append(Symbol("class", self.module, node.name, self.filepath, node.lineno))
-        self._class_stack.append(node.name)
-        self.generic_visit(node)
-        self._class_stack.pop()
-
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:  # noqa: N802
-        if self._class_stack:
-            qual = f"{self._class_stack[-1]}.{node.name}"
-            self.symbols.append(Symbol("method", self.module, qual, self.filepath, node.lineno))
-        else:
-            self.symbols.append(Symbol("func", self.module, node.name, self.filepath, node.lineno))
-        self.generic_visit(node)
-
-    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:  # noqa: N802
-        self.visit_FunctionDef(node)  # treat same as sync
-
-
-class CollectImports(ast.NodeVisitor):
-    def __init__(self) -> None:
+        # usages
+        self.names: Set[str] = set()
+        self.attrs: Set[str] = set()
+        # imports
         self.bound_names: Set[str] = set()
         self.imported_modules: Set[str] = set()  # for module import graph
 
-    def visit_Import(self, node: ast.Import) -> None:  # noqa: N802
-        for alias in node.names:
-            # Binding name is the top-level package unless aliased
-            bound = alias.asname or alias.name.split(".")[0]
-            self.bound_names.add(bound)
-            self.imported_modules.add(alias.name.split(".")[0])
-
-    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:  # noqa: N802
-        if node.module is None:
-            return
-        top = node.module.split(".")[0]
-        self.imported_modules.add(top)
-        for alias in node.names:
-            if alias.name == "*":
+    def collect(self, tree: ast.AST) -> None:
+        # Flat ast.walk with exact type checks instead of NodeVisitor dispatch
+        names, attrs = self.names, self.attrs
+        bound, imported = self.bound_names, self.imported_modules
+        for node in ast.walk(tree):
+            t = type(node)
+            if t is ast.Name:
+                names.add(node.id)
+            elif t is ast.Attribute:
+                # Record attribute name usage (e.g., module.func, obj.method)
+                attrs.add(node.attr)
+            elif t is ast.Import:
+                for alias in node.names:
+                    # Binding name is the top-level package unless aliased
+                    bound.add(alias.asname or alias.name.split(".")[0])
+                    imported.add(alias.name.split(".")[0])
+            elif t is ast.ImportFrom:
+                if node.module is None:
+                    continue
+                imported.add(node.module.split(".")[0])
+                for alias in node.names:
+                    if alias.name != "*":
+                        bound.add(alias.asname or alias.name)
+        if self.module:
+            self._collect_defs(tree, None)
+
+    def _collect_defs(self, node: ast.AST, cls: Optional[str]) -> None:
+        # Definitions are statements, so expression subtrees can be skipped
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.expr):
                 continue
-            bound = alias.asname or alias.name
-            self.bound_names.add(bound)
+            if isinstance(child, ast.ClassDef):
+                self.symbols.append(Symbol("class", self.module, child.name, self.filepath, child.lineno))
+                self._collect_defs(child, child.name)
+            elif isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                if cls:
+                    qual = f"{cls}.{child.name}"
+                    self.symbols.append(Symbol("method", self.module, qual, self.filepath, child.lineno))
+                else:
+                    self.symbols.append(Symbol("func", self.module, child.name, self.filepath, child.lineno))
+                self._collect_defs(child, cls)
+            else:
+                self._collect_defs(child, cls)
 
 
 def parse(path: Path) -> Optional[ast.AST]:
     try:
-        return ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+        # ast.parse decodes bytes itself (PEP 263), no intermediate str
+        return ast.parse(path.read_bytes(), filename=str(path))
     except Exception:
         return None
 
 
+def analyze(path: Path) -> Optional[CollectAll]:
+    """Parse one file and run the collector over it (None if it does not parse)."""
+    tree = parse(path)
+    if not tree:
+        return None
+    ca = CollectAll(module_name_for(path), path)
+    ca.collect(tree)
+    return ca
+
+
 def main() -> None:
+    # Parse every file once; a single visitor pass collects everything
+    src_files = list(iter_py_files(SRC))
+    all_files = src_files + list(iter_py_files(TESTS))
+    results = [analyze(f) for f in all_files]
+    collected: Dict[Path, CollectAll] = {
+        f: ca for f, ca in zip(all_files, results) if ca is not None
+    }
+
     # Index definitions in src/
     defs: List[Symbol] = []
-    src_files = list(iter_py_files(SRC))
     for f in src_files:
-        mod = module_name_for(f)
-        if not mod:
-            continue
-        tree = parse(f)
-        if not tree:
-            continue
-        cd = CollectDefs(mod, f)
-        cd.visit(tree)
-        defs.extend(cd.symbols)
+        ca = collected.get(f)
+        if ca is not None:
+            defs.extend(ca.symbols)
 
     # Gather usages across src/ and tests/
     global_names: Set[str] = set()
@@ -148,38 +166,28 @@ def main() -> None:
     module_used_attrs: Dict[Path, Set[str]] = {}
     imported_modules_by: Dict[str, Set[str]] = {}
 
-    all_files = src_files + list(iter_py_files(TESTS))
-    for f in all_files:
-        tree = parse(f)
-        if not tree:
-            continue
-        uses = CollectUses()
-        uses.visit(tree)
-        global_names |= uses.names
-        global_attrs |= uses.attrs
-        module_used_names[f] = uses.names
-        module_used_attrs[f] = uses.attrs
+    for f, ca in collected.items():
+        global_names |= ca.names
+        global_attrs |= ca.attrs
+        module_used_names[f] = ca.names
+        module_used_attrs[f] = ca.attrs
 
         # import graph
-        ci = CollectImports()
-        ci.visit(tree)
-        for mod in ci.imported_modules:
+        for mod in ca.imported_modules:
             imported_modules_by.setdefault(mod, set()).add(str(f))
 
     # Per-file unused imports
     per_file_unused_imports: Dict[Path, List[str]] = {}
     for f in src_files:
-        tree = parse(f)
-        if not tree:
+        ca = collected.get(f)
+        if ca is None:
             continue
-        ci = CollectImports()
-        ci.visit(tree)
         # Skip package __init__.py re-export modules and __future__ imports
         if f.name == "__init__.py":
             continue
         used = module_used_names.get(f, set())
         unused: List[str] = []
-        for name in ci.bound_names:
+        for name in ca.bound_names:
             if name == "annotations":  # from __future__ import annotations
                 continue
             if name not in used:
@@ -189,26 +197,26 @@ def main() -> None:
             per_file_unused_imports[f] = unused
 
     # Candidates: top-level funcs/classes whose names are never referenced
-    dead_funcs: List[Symbol] = []
-    dead_classes: List[Symbol] = []
+    names = frozenset(global_names)
+    attrs = frozenset(global_attrs)
+    # Break out class method names into the method part for attribute matching
+    unused_defs = [
+        (sym, method_part)
+        for sym in defs
+        for method_part in (sym.name.rsplit(".", 1)[-1],)
+        if sym.name not in names and method_part not in attrs and method_part not in names
+    ]
+    # Allow dunder and private names to be ignored in dead-code reporting
+    dead_funcs: List[Symbol] = [
+        s for s, _ in unused_defs if s.kind == "func" and not s.name.startswith("__")
+    ]
+    dead_classes: List[Symbol] = [
+        s for s, _ in unused_defs if s.kind == "class" and not s.name.startswith("__")
+    ]
     # For methods, too noisy; compute but keep separate
-    dead_methods: List[Symbol] = []
-
-    for sym in defs:
-        name = sym.name
-        # Break out class method names into the method part for attribute matching
-        method_part = name.split(".")[-1]
-        used = (name in global_names) or (method_part in global_attrs) or (method_part in global_names)
-        # Allow dunder and private names to be ignored in dead-code reporting
-        if sym.kind == "func":
-            if (not used) and not name.startswith("__"):
-                dead_funcs.append(sym)
-        elif sym.kind == "class":
-            if (not used) and not name.startswith("__"):
-                dead_classes.append(sym)
-        elif sym.kind == "method":
-            if (not used) and not method_part.startswith("__"):
-                dead_methods.append(sym)
+    dead_methods: List[Symbol] = [
+        s for s, mp in unused_defs if s.kind == "method" and not mp.startswith("__")
+    ]
 
     # Modules under our namespace that are never imported by others (excluding __main__)
     src_modules = set()
@@ -221,42 +229,49 @@ def main() -> None:
         if m != "__main__" and not imported_modules_by.get(m)
     ]
 
-    # Report
-    print("== Dead code candidates (heuristic) ==")
-    print(f"Top-level functions: {len(dead_funcs)}")
-    for s in sorted(dead_funcs, key=lambda x: (x.filepath.as_posix(), x.lineno)):
-        rel = s.filepath.relative_to(ROOT).as_posix()
-        print(f"  - {rel}:{s.lineno}  {s.module}.{s.name}")
+    # Report (collected and written to stdout in one call)
+    rel_cache: Dict[Path, str] = {}
+
+    def _rel(path: Path) -> str:
+        rel = rel_cache.get(path)
+        if rel is None:
+            rel = rel_cache[path] = path.relative_to(ROOT).as_posix()
+        return rel
+
+    def _fmt(s: Symbol) -> str:
+        return f"  - {_rel(s.filepath)}:{s.lineno}  {s.module}.{s.name}"
 
-    print(f"\nClasses: {len(dead_classes)}")
-    for s in sorted(dead_classes, key=lambda x: (x.filepath.as_posix(), x.lineno)):
-        rel = s.filepath.relative_to(ROOT).as_posix()
-        print(f"  - {rel}:{s.lineno}  {s.module}.{s.name}")
+    def _by_location(syms: List[Symbol]) -> List[Symbol]:
+        return sorted(syms, key=lambda x: (x.filepath.as_posix(), x.lineno))
+
+    out: List[str] = []
+    out.append("== Dead code candidates (heuristic) ==")
+    out.append(f"Top-level functions: {len(dead_funcs)}")
+    out.extend(map(_fmt, _by_location(dead_funcs)))
+
+    out.append(f"\nClasses: {len(dead_classes)}")
+    out.extend(map(_fmt, _by_location(dead_classes)))
 
     if dead_methods:
-        print(f"\nMethods (no references found): {len(dead_methods)}")
+        out.append(f"\nMethods (no references found): {len(dead_methods)}")
         # Show only first 20 to limit noise
-        shown = 0
-        for s in sorted(dead_methods, key=lambda x: (x.filepath.as_posix(), x.lineno)):
-            rel = s.filepath.relative_to(ROOT).as_posix()
-            print(f"  - {rel}:{s.lineno}  {s.module}.{s.name}")
-            shown += 1
-            if shown >= 20:
-                print("    ... (truncated)")
-                break
-
-    print("\n== Unused imports (per file) ==")
+        out.extend(map(_fmt, _by_location(dead_methods)[:20]))
+        if len(dead_methods) >= 20:
+            out.append("    ... (truncated)")
+
+    out.append("\n== Unused imports (per file) ==")
     if not per_file_unused_imports:
-        print("  None found")
+        out.append("  None found")
     else:
         for f, names in sorted(per_file_unused_imports.items(), key=lambda x: x[0].as_posix()):
-            rel = f.relative_to(ROOT).as_posix()
-            print(f"  - {rel}: {', '.join(names)}")
+            out.append(f"  - {_rel(f)}: {', '.join(names)}")
 
     if never_imported_modules:
-        print("\n== Modules never imported by others ==")
+        out.append("\n== Modules never imported by others ==")
         for m in never_imported_modules:
-            print(f"  - {m}")
+            out.append(f"  - {m}")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
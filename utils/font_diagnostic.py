@@ -6,14 +6,45 @@ This utility helps diagnose font availability on different systems and provides
 guidance for font configuration using environment variables.
 """
 
+import json
 import os
 import sys
 import platform
+import tempfile
+from functools import cache, lru_cache
+from itertools import islice
 from PIL import Image, ImageDraw, ImageFont
 
 
+@lru_cache(maxsize=512)
+def _exists(path):
+    """os.path.exists, probed once per path (misses included)."""
+    return os.path.exists(path)
+
+
+@lru_cache(maxsize=512)
+def _truetype(font_path, size):
+    """Load a font once per (path, size); a failure is cached as its exception."""
+    try:
+        return ImageFont.truetype(font_path, size)
+    except Exception as e:
+        return e
+
+
+def _load_truetype(font_path, size):
+    font = _truetype(font_path, size)
+    if isinstance(font, Exception):
+        raise font
+    return font
+
+
+@cache
 def get_system_info():
-    """Get system information for font diagnostics."""
+    """Get system information for font diagnostics.
+
+    This and the directory/font/guide lookups below are computed once per
+    process; treat the returned objects as read-only.
+    """
     return {
         "system": platform.system(),
         "release": platform.release(),
@@ -23,10 +54,13 @@ def get_system_info():
     }
 
 
+@cache
 def find_common_font_directories():
     """Find common font directories on the current system."""
     system = platform.system()
     directories = []
+    # One home lookup; trailing separators stripped as expanduser("~/x") does
+    home = os.path.expanduser("~").rstrip("/\\")
 
     if system == "Darwin":  # macOS
         directories = [
@@ -34,12 +68,12 @@ def find_common_font_directories():
             "/Library/Fonts/",
             "/usr/local/share/fonts/",
             "/opt/homebrew/share/fonts/",
-            os.path.expanduser("~/Library/Fonts/"),
+            home + "/Library/Fonts/",
         ]
     elif system == "Windows":
         directories = [
             "C:/Windows/Fonts/",
-            os.path.expanduser("~/AppData/Local/Microsoft/Windows/Fonts/"),
+            home + "/AppData/Local/Microsoft/Windows/Fonts/",
         ]
     else:  # Linux and others
         directories = [
@@ -47,37 +81,139 @@ def find_common_font_directories():
             "/usr/local/share/fonts/",
             "/usr/share/fonts/truetype/",
             "/usr/share/fonts/TTF/",
-            os.path.expanduser("~/.fonts/"),
-            os.path.expanduser("~/.local/share/fonts/"),
+            home + "/.fonts/",
+            home + "/.local/share/fonts/",
         ]
 
     # Filter existing directories
     existing_dirs = []
     for directory in directories:
-        if os.path.exists(directory):
+        if _exists(directory):
             existing_dirs.append(directory)
 
     return existing_dirs
 
 
-def scan_font_files(directories):
-    """Scan directories for font files."""
-    font_extensions = {".ttf", ".ttc", ".otf", ".woff", ".woff2"}
-    found_fonts = {}
+# A tuple lets str.endswith test every extension in one call
+_FONT_EXT_TUPLE = (".ttf", ".ttc", ".otf", ".woff", ".woff2")
+
+
+def _iter_font_files(directory, seen=None):
+    """Yield (file name, path) for font files under directory, in os.walk order.
+
+    If given, `seen` receives (directory, mtime_ns) for every listed directory.
+    """
+    if seen is not None:
+        # Stat before listing so a concurrent change invalidates the result
+        seen.append((directory, os.stat(directory).st_mtime_ns))
+    # Files of a directory first, then its subdirs. DirEntry types come from
+    # the listing, so no extra stat per entry.
+    subdirs = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.name.lower().endswith(_FONT_EXT_TUPLE):
+                yield entry.name, entry.path
+    for sub in subdirs:
+        try:
+            yield from _iter_font_files(sub, seen)
+        except OSError:
+            # Unreadable subdirectories are skipped, as os.walk does
+            pass
 
+
+# On-disk scan results, reused while none of the scanned directories changed
+_SCAN_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "quadre", "font_scan.json")
+_SCAN_CACHE_VERSION = 2
+
+
+def _load_scan_cache():
+    try:
+        with open(_SCAN_CACHE_FILE, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _SCAN_CACHE_VERSION:
+        return {}
+    entries = data.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+
+def _save_scan_cache(entries):
+    cache_dir = os.path.dirname(_SCAN_CACHE_FILE)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write a temp file and rename it so readers never see a partial file
+        fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": _SCAN_CACHE_VERSION, "entries": entries}, f)
+            os.replace(tmp, _SCAN_CACHE_FILE)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        pass
+
+
+def _dirs_unchanged(dirs):
+    try:
+        return all(os.stat(d).st_mtime_ns == mtime for d, mtime in dirs)
+    except OSError:
+        return False
+
+
+def _cached_font_files(directory, entries):
+    """List (file name, path) for font files under directory via the scan cache.
+
+    `entries` is the dict returned by _load_scan_cache(); a miss rescans the
+    tree and updates it in place. Returns (files, hit). A hit costs one stat
+    per directory instead of listing every file. Adding or removing a file or
+    subdirectory changes its parent's mtime, which invalidates the entry.
+    """
+    key = os.path.abspath(directory)
+    hit = entries.get(key)
+    if isinstance(hit, dict) and _dirs_unchanged(hit.get("dirs", ())):
+        return [tuple(f) for f in hit.get("files", ())], True
+    seen = []
+    files = list(_iter_font_files(directory, seen))
+    entries[key] = {"dirs": seen, "files": files}
+    return files, False
+
+
+def cached_font_files(directories):
+    """List (file name, path) for font files in directories, reusing the disk cache.
+
+    The cache file under ~/.cache/quadre is read once and written at most
+    once per call. A directory whose entry is stale or missing is scanned
+    in full.
+    """
+    entries = _load_scan_cache()
+    files = []
+    dirty = False
     for directory in directories:
         try:
-            for root, dirs, files in os.walk(directory):
-                for file in files:
-                    if any(file.lower().endswith(ext) for ext in font_extensions):
-                        font_path = os.path.join(root, file)
-                        font_name = os.path.splitext(file)[0]
-                        found_fonts[font_name] = font_path
+            found, hit = _cached_font_files(directory, entries)
         except PermissionError:
             print(f"Permission denied: {directory}")
+            continue
         except Exception as e:
             print(f"Error scanning {directory}: {e}")
+            continue
+        files.extend(found)
+        dirty = dirty or not hit
+    if dirty:
+        _save_scan_cache(entries)
+    return files
 
+
+def scan_font_files(directories):
+    """Map font name -> path for font files in directories (via the scan cache)."""
+    found_fonts = {}
+    for file, font_path in cached_font_files(directories):
+        # The name ends with a known extension, so cut at the last dot
+        found_fonts[file[: file.rfind(".")]] = font_path
     return found_fonts
 
 
@@ -86,86 +222,93 @@ def test_font_loading(font_path, sizes=[12, 18, 24]):
     results = {}
     for size in sizes:
         try:
-            _font = ImageFont.truetype(font_path, size)
+            _font = _load_truetype(font_path, size)
             results[size] = "✓"
         except Exception as e:
             results[size] = f"✗ {str(e)[:50]}"
     return results
 
 
+# Recommended fonts per platform: (name, candidate paths in order of preference)
+_RECOMMENDED_MACOS = (
+    ("Helvetica", ("/System/Library/Fonts/Helvetica.ttc", "/Library/Fonts/Helvetica.ttf")),
+    ("Arial", ("/Library/Fonts/Arial.ttf", "/System/Library/Fonts/Arial.ttf")),
+    ("San Francisco", ("/System/Library/Fonts/SFNS.ttf", "/System/Library/Fonts/SFNSDisplay.ttf")),
+    (
+        "DejaVu Sans",
+        ("/usr/local/share/fonts/DejaVuSans.ttf", "/opt/homebrew/share/fonts/DejaVuSans.ttf"),
+    ),
+)
+_RECOMMENDED_WINDOWS = (
+    ("Arial", ("C:/Windows/Fonts/arial.ttf",)),
+    ("Calibri", ("C:/Windows/Fonts/calibri.ttf",)),
+    ("Segoe UI", ("C:/Windows/Fonts/segoeui.ttf",)),
+    ("Verdana", ("C:/Windows/Fonts/verdana.ttf",)),
+)
+_RECOMMENDED_LINUX = (
+    (
+        "DejaVu Sans",
+        ("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", "/usr/share/fonts/TTF/DejaVuSans.ttf"),
+    ),
+    ("Liberation Sans", ("/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",)),
+    ("Ubuntu", ("/usr/share/fonts/truetype/ubuntu/Ubuntu-R.ttf",)),
+)
+
+
+@cache
 def find_recommended_fonts():
     """Find recommended fonts for quadre."""
     system = platform.system()
-
     if system == "Darwin":  # macOS
-        recommended = {
-            "Helvetica": [
-                "/System/Library/Fonts/Helvetica.ttc",
-                "/Library/Fonts/Helvetica.ttf",
-            ],
-            "Arial": ["/Library/Fonts/Arial.ttf", "/System/Library/Fonts/Arial.ttf"],
-            "San Francisco": [
-                "/System/Library/Fonts/SFNS.ttf",
-                "/System/Library/Fonts/SFNSDisplay.ttf",
-            ],
-            "DejaVu Sans": [
-                "/usr/local/share/fonts/DejaVuSans.ttf",
-                "/opt/homebrew/share/fonts/DejaVuSans.ttf",
-            ],
-        }
+        recommended = _RECOMMENDED_MACOS
     elif system == "Windows":
-        recommended = {
-            "Arial": ["C:/Windows/Fonts/arial.ttf"],
-            "Calibri": ["C:/Windows/Fonts/calibri.ttf"],
-            "Segoe UI": ["C:/Windows/Fonts/segoeui.ttf"],
-            "Verdana": ["C:/Windows/Fonts/verdana.ttf"],
-        }
+        recommended = _RECOMMENDED_WINDOWS
     else:  # Linux
-        recommended = {
-            "DejaVu Sans": [
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-                "/usr/share/fonts/TTF/DejaVuSans.ttf",
-            ],
-            "Liberation Sans": [
-                "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf"
-            ],
-            "Ubuntu": ["/usr/share/fonts/truetype/ubuntu/Ubuntu-R.ttf"],
-        }
+        recommended = _RECOMMENDED_LINUX
 
     available_fonts = {}
-    for font_name, paths in recommended.items():
-        for path in paths:
-            if os.path.exists(path):
-                available_fonts[font_name] = path
-                break
+    for font_name, paths in recommended:
+        # First existing candidate wins
+        path = next((p for p in paths if _exists(p)), None)
+        if path is not None:
+            available_fonts[font_name] = path
 
     return available_fonts
 
 
-def test_ez_pillow_font_loading():
-    """Test the quadre font loading function (same API)."""
-    try:
-        # Add src to path
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        src_dir = os.path.join(script_dir, "..", "src")
+@cache
+def _quadre_load_font():
+    """Import quadre's load_font once; returns (load_font, None) or (None, error)."""
+    # Add src to path (once, and only if it is not there yet)
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    src_dir = os.path.join(script_dir, "..", "src")
+    if src_dir not in sys.path:
         sys.path.insert(0, src_dir)
-
+    try:
         from quadre.components.config import load_font
+    except ImportError as e:
+        return None, e
+    return load_font, None
 
-        sizes = [20, 24, 30, 36, 42]
-        results = {}
 
-        for size in sizes:
-            try:
-                font = load_font(size, False)
-                font_name = getattr(font, "path", "Default PIL Font")
-                results[size] = f"✓ {font_name}"
-            except Exception as e:
-                results[size] = f"✗ {str(e)}"
+def test_ez_pillow_font_loading():
+    """Test the quadre font loading function (same API)."""
+    load_font, err = _quadre_load_font()
+    if load_font is None:
+        return {"error": f"Could not import quadre config: {err}"}
 
-        return results
-    except ImportError as e:
-        return {"error": f"Could not import quadre config: {e}"}
+    sizes = [20, 24, 30, 36, 42]
+    results = {}
+
+    for size in sizes:
+        try:
+            font = load_font(size, False)
+            font_name = getattr(font, "path", "Default PIL Font")
+            results[size] = f"✓ {font_name}"
+        except Exception as e:
+            results[size] = f"✗ {str(e)}"
+
+    return results
 
 
 def create_font_test_image(font_path, output_path="font_test.png"):
@@ -182,7 +325,7 @@ def create_font_test_image(font_path, output_path="font_test.png"):
 
         for size in sizes:
             try:
-                font = ImageFont.truetype(font_path, size)
+                font = _load_truetype(font_path, size)
                 draw.text(
                     (50, y_pos), f"Size {size}: {test_text}", font=font, fill="black"
                 )
@@ -196,12 +339,14 @@ def create_font_test_image(font_path, output_path="font_test.png"):
         # Add font info
         draw.text((50, 10), f"Font: {os.path.basename(font_path)}", fill="blue")
 
-        img.save(output_path)
+        # Throwaway preview: fast zlib level over a smaller file
+        img.save(output_path, optimize=False, compress_level=1)
         return output_path
     except Exception as e:
         return f"Error creating test image: {e}"
 
 
+@cache
 def generate_font_installation_guide():
     """Generate installation guide for missing fonts."""
     system = platform.system()
@@ -274,8 +419,8 @@ def main():
     # System information
     sys_info = get_system_info()
     print("System Information:")
-    for key, value in sys_info.items():
-        print(f"  {key}: {value}")
+    # One print per section instead of one per line
+    print("\n".join(f"  {key}: {value}" for key, value in sys_info.items()))
     print()
 
     # Environment variables
@@ -283,7 +428,7 @@ def main():
     custom_font = os.environ.get("quadre_FONT_PATH")
     if custom_font:
         print(f"  quadre_FONT_PATH: {custom_font}")
-        if os.path.exists(custom_font):
+        if _exists(custom_font):
             print("  ✓ Custom font path exists")
         else:
             print("  ✗ Custom font path does not exist")
@@ -294,10 +439,9 @@ def main():
     # Font directories
     print("Font Directories:")
     font_dirs = find_common_font_directories()
-    for directory in font_dirs:
-        print(f"  ✓ {directory}")
-
-    if not font_dirs:
+    if font_dirs:
+        print("\n".join(f"  ✓ {directory}" for directory in font_dirs))
+    else:
         print("  ✗ No common font directories found")
     print()
 
@@ -305,10 +449,12 @@ def main():
     print("Recommended Fonts:")
     recommended = find_recommended_fonts()
     if recommended:
+        lines = []
         for font_name, path in recommended.items():
             test_result = test_font_loading(path, [24])
             status = "✓" if "✓" in str(test_result) else "✗"
-            print(f"  {status} {font_name}: {path}")
+            lines.append(f"  {status} {font_name}: {path}")
+        print("\n".join(lines))
     else:
         print("  ✗ No recommended fonts found")
     print()
@@ -319,21 +465,23 @@ def main():
     if "error" in ez_results:
         print(f"  ✗ {ez_results['error']}")
     else:
-        for size, result in ez_results.items():
-            print(f"  Size {size}: {result}")
+        print("\n".join(f"  Size {size}: {result}" for size, result in ez_results.items()))
     print()
 
     # Scan all fonts (limited output)
     print("Available Fonts (sample):")
+    # The count needs the full listing anyway, so scan once (through the
+    # on-disk scan cache) and take both the count and the sample from it
     all_fonts = scan_font_files(font_dirs[:2])  # Limit to first 2 directories
     font_count = len(all_fonts)
     print(f"  Found {font_count} font files")
 
     # Show first 10 fonts as sample
-    for i, (name, path) in enumerate(list(all_fonts.items())[:10]):
-        print(f"  - {name}")
-        if i == 9 and font_count > 10:
-            print(f"  ... and {font_count - 10} more")
+    lines = [f"  - {name}" for name in islice(all_fonts, 10)]
+    if len(lines) == 10 and font_count > 10:
+        lines.append(f"  ... and {font_count - 10} more")
+    if lines:
+        print("\n".join(lines))
     print()
 
     # Create test image if we have a good font
@@ -354,7 +502,7 @@ def main():
 
     # Recommendations
     print("Recommendations:")
-    if custom_font and os.path.exists(custom_font):
+    if custom_font and _exists(custom_font):
         print("  ✓ Custom font path is configured and working")
     elif recommended:
         best_font_path = list(recommended.values())[0]